@@ -1,83 +1,184 @@
 # BioNexus Backend Configuration
+import json
 import os
-from typing import List
-from pydantic_settings import BaseSettings
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Dict, Tuple
 
-class Settings(BaseSettings):
+
+def _load_env_file(path: str = ".env") -> Dict[str, str]:
+    """Parse a KEY=VALUE .env file in a single pass (missing file -> {})."""
+    try:
+        with open(path, "rb") as fh:
+            lines = fh.read().decode("utf-8").splitlines()
+    except OSError:
+        return {}
+
+    values = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#") or "=" not in line:
+            continue
+        if line.startswith("export "):
+            line = line[7:]
+        key, value = line.split("=", 1)
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        values[key.strip().upper()] = value
+    return values
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _parse_list(value: str) -> Tuple[str, ...]:
+    value = value.strip()
+    if value.startswith("["):
+        return tuple(json.loads(value))
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+# Fields that are not plain strings and need explicit coercion from the environment
+_COERCE = {
+    "debug": _parse_bool,
+    "port": int,
+    "neo4j_pool_min": int,
+    "neo4j_pool_size": int,
+    "neo4j_acq_timeout_s": float,
+    "milvus_pool_min": int,
+    "workers": int,
+    "max_upload_size": int,
+    "batch_size": int,
+    "max_pages_per_pdf": int,
+    "ocr_timeout": int,
+    "embedding_timeout": int,
+    "access_token_expire_minutes": int,
+    "cache_ttl": int,
+    "enable_metrics": _parse_bool,
+    "metrics_port": int,
+    "health_ttl_seconds": float,
+    "export_cache_ttl": int,
+    "cors_origins": _parse_list,
+}
+
+# Environment variable names that differ from the upper-cased field name
+_ENV_ALIASES = {
+    "neo4j_user": ("NEO4J_USER", "NEO4J_USERNAME"),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
     # Application
     app_name: str = "BioNexus"
     debug: bool = False
     version: str = "1.0.0"
-    
+
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
     workers: int = 4
-    
+
     # Neo4j Aura (Cloud Knowledge Graph)
-    neo4j_uri: str = os.getenv("NEO4J_URI", "neo4j+s://your-neo4j-instance.databases.neo4j.io")
-    neo4j_user: str = os.getenv("NEO4J_USERNAME", "neo4j")
-    neo4j_password: str = os.getenv("NEO4J_PASSWORD", "")
+    neo4j_uri: str = "neo4j+s://your-neo4j-instance.databases.neo4j.io"
+    neo4j_user: str = "neo4j"
+    neo4j_password: str = ""
     neo4j_database: str = "neo4j"
-    
+    neo4j_pool_min: int = 4  # Sessions warmed with RETURN 1 at startup
+    neo4j_pool_size: int = 50  # max_connection_pool_size, per driver
+    neo4j_acq_timeout_s: float = 60.0  # Wait for a free pooled connection before failing
+
     # Milvus Cloud (Vector Database)
-    milvus_uri: str = os.getenv("MILVUS_URI", "")
-    milvus_token: str = os.getenv("MILVUS_TOKEN", "")
+    milvus_uri: str = ""
+    milvus_token: str = ""
     milvus_collection_name: str = "bionexus_embeddings"
-    
+    milvus_pool_min: int = 1  # Warm-up queries issued at startup
+
     # Google Cloud Storage (Object Storage)
     gcs_bucket_name: str = "bionexus-documents"
     gcs_credentials_path: str = ""  # Path to service account JSON
     gcs_project_id: str = ""
-    
 
-    
+
+
     # ML Models
     huggingface_api_key: str = ""
     colpali_model: str = "vidore/colpali-v1.3-hf"
     spacy_model: str = "en_ner_bionlp13cg_md"
     device: str = "auto"
-    
+
     # CORS (Updated for Cloud Deployment)
-    cors_origins: List[str] = [
-        "http://localhost:3000", 
+    cors_origins: Tuple[str, ...] = (
+        "http://localhost:3000",
         "http://localhost:3001",
         "https://app.bionexus.space",
         "https://bionexus.space",
         "https://*.run.app",  # Google Cloud Run domains
         "https://*.googleusercontent.com"  # Google Cloud domains
-    ]
-    
+    )
+
     # File Processing
     max_upload_size: int = 100_000_000  # 100MB
     batch_size: int = 32
     max_pages_per_pdf: int = 500
     ocr_timeout: int = 300
     embedding_timeout: int = 600
-    
+
     # Logging
     log_level: str = "INFO"
-    
+
     # Security
     secret_key: str = "your-secret-key-change-this-in-production"
     access_token_expire_minutes: int = 30
-    
+    admin_token: str = ""  # X-Admin-Token for admin routes; empty disables them
+
     # Google Cloud Memorystore (Redis)
     redis_url: str = "redis://10.0.0.1:6379"  # Internal GCP Redis instance
     cache_ttl: int = 3600
-    
+    export_cache_ttl: int = 300  # In-process cache lifetime for finished /export bodies
+
     # Cloud Environment
     cloud_environment: str = "gcp"  # gcp, aws, azure
     environment: str = "production"  # development, staging, production
-    
+
     # Monitoring
     enable_metrics: bool = True
     metrics_port: int = 9090
+    health_ttl_seconds: float = 5.0  # Cache lifetime for /health and /stats probes
+
+
+# Set once the .env file has been merged into os.environ. Worker processes
+# inherit the environment from their parent, so they skip re-reading the file.
+_ENV_LOADED_FLAG = "BIONEXUS_ENV_LOADED"
+
+
+def _env_overrides(env_file: str = ".env") -> Dict[str, object]:
+    """Collect field overrides; process environment wins over the .env file."""
+    if os.environ.get(_ENV_LOADED_FLAG) != "1":
+        for key, value in _load_env_file(env_file).items():
+            os.environ.setdefault(key, value)
+        os.environ[_ENV_LOADED_FLAG] = "1"
+
+    source = {key.upper(): value for key, value in os.environ.items()}
+
+    overrides = {}
+    for f in fields(Settings):
+        for env_name in _ENV_ALIASES.get(f.name, (f.name.upper(),)):
+            if env_name in source:
+                raw = source[env_name]
+                coerce = _COERCE.get(f.name)
+                overrides[f.name] = coerce(raw) if coerce else raw
+                break
+    return overrides
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsed only once."""
+    return Settings(**_env_overrides())
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        extra = "ignore"  # Ignore extra fields in .env
 
 # Global settings instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
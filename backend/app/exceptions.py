@@ -2,132 +2,156 @@
 Exception handling and error responses for BioNexus API
 """
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 import logging
-import traceback
-from datetime import datetime
+import orjson
+import sys
 from typing import Dict, Any
 
+from .utils import utc_timestamp
+
 logger = logging.getLogger(__name__)
 
+# Interned error codes shared by every raise/response
+_CODES = {
+    code: sys.intern(code)
+    for code in (
+        "BIONEXUS_ERROR",
+        "DATABASE_CONNECTION_ERROR",
+        "PROCESSING_ERROR",
+        "SEARCH_ERROR",
+        "VALIDATION_ERROR",
+        "INTERNAL_SERVER_ERROR",
+    )
+}
+
 
 class BioNexusException(Exception):
     """Base exception for BioNexus application"""
     
     def __init__(self, message: str, error_code: str = None, details: Dict[str, Any] = None):
         self.message = message
-        self.error_code = error_code or "BIONEXUS_ERROR"
+        self.error_code = _CODES.get(error_code, error_code) if error_code else _CODES["BIONEXUS_ERROR"]
         self.details = details or {}
         super().__init__(self.message)
 
+    def to_bytes(self, path: str) -> bytes:
+        """Serialize the standard error body for this exception"""
+        return orjson.dumps({
+            "error": True,
+            "error_code": self.error_code,
+            "message": self.message,
+            "details": self.details,
+            "path": path,
+        }, default=str)
+
 
 class DatabaseConnectionError(BioNexusException):
     """Raised when database connection fails"""
     
     def __init__(self, message: str = "Database connection failed", details: Dict[str, Any] = None):
-        super().__init__(message, "DATABASE_CONNECTION_ERROR", details)
+        super().__init__(message, _CODES["DATABASE_CONNECTION_ERROR"], details)
 
 
 class ProcessingError(BioNexusException):
     """Raised when document processing fails"""
     
     def __init__(self, message: str = "Document processing failed", details: Dict[str, Any] = None):
-        super().__init__(message, "PROCESSING_ERROR", details)
+        super().__init__(message, _CODES["PROCESSING_ERROR"], details)
 
 
 class SearchError(BioNexusException):
     """Raised when search operation fails"""
     
     def __init__(self, message: str = "Search operation failed", details: Dict[str, Any] = None):
-        super().__init__(message, "SEARCH_ERROR", details)
+        super().__init__(message, _CODES["SEARCH_ERROR"], details)
 
 
 class ValidationError(BioNexusException):
     """Raised when input validation fails"""
     
     def __init__(self, message: str = "Input validation failed", details: Dict[str, Any] = None):
-        super().__init__(message, "VALIDATION_ERROR", details)
+        super().__init__(message, _CODES["VALIDATION_ERROR"], details)
 
 
-async def bionexus_exception_handler(request: Request, exc: BioNexusException) -> JSONResponse:
+# Handlers stay `async def` even though they never await: Starlette awaits
+# coroutine handlers inline but dispatches plain functions to run_in_threadpool.
+async def bionexus_exception_handler(request: Request, exc: BioNexusException) -> Response:
     """Handle BioNexus application exceptions"""
+    path = request.scope["path"]
     
     logger.error(
         f"BioNexus exception: {exc.error_code} - {exc.message}",
-        extra={"details": exc.details, "path": request.url.path}
+        extra={"details": exc.details, "path": path}
     )
     
-    return JSONResponse(
+    return Response(
+        exc.to_bytes(path),
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": True,
-            "error_code": exc.error_code,
-            "message": exc.message,
-            "details": exc.details,
-            "path": str(request.url.path),
-        }
+        media_type="application/json"
     )
 
 
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """Handle HTTP exceptions"""
+    path = request.scope["path"]
     
     logger.warning(
         f"HTTP exception: {exc.status_code} - {exc.detail}",
-        extra={"path": request.url.path}
+        extra={"path": path}
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": True,
             "error_code": f"HTTP_{exc.status_code}",
             "message": exc.detail,
-            "path": str(request.url.path),
+            "path": path,
         }
     )
 
 
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """Handle request validation errors"""
+    path = request.scope["path"]
     
     logger.warning(
         f"Validation error: {exc.errors()}",
-        extra={"path": request.url.path}
+        extra={"path": path}
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": True,
-            "error_code": "VALIDATION_ERROR",
+            "error_code": _CODES["VALIDATION_ERROR"],
             "message": "Request validation failed",
             "details": exc.errors(),
-            "path": str(request.url.path),
+            "path": path,
         }
     )
 
 
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """Handle unexpected exceptions"""
+    path = request.scope["path"]
     
-    # Log the full traceback for debugging
+    # Log the full traceback for debugging; formatting is deferred to the handler
     logger.error(
-        f"Unexpected exception: {type(exc).__name__}: {str(exc)}",
-        extra={
-            "path": request.url.path,
-            "traceback": traceback.format_exc()
-        }
+        "Unexpected exception: %s: %s", type(exc).__name__, exc,
+        exc_info=exc,
+        extra={"path": path}
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": True,
-            "error_code": "INTERNAL_SERVER_ERROR",
+            "error_code": _CODES["INTERNAL_SERVER_ERROR"],
             "message": "An unexpected error occurred",
-            "path": str(request.url.path),
+            "path": path,
         }
     )
 
@@ -138,17 +162,17 @@ def create_error_response(
     message: str,
     status_code: int = 500,
     details: Dict[str, Any] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """Create standardized error response"""
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
         content={
             "error": True,
             "error_code": error_code,
             "message": message,
             "details": details or {},
-            "timestamp": str(datetime.utcnow()),
+            "timestamp": utc_timestamp(),
         }
     )
 
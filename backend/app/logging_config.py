@@ -1,14 +1,25 @@
 """
 Logging configuration for BioNexus backend
 """
+import atexit
+import copy
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import sys
 from pathlib import Path
 
-# Create logs directory if it doesn't exist
+# Skip per-record thread/process lookups and the findCaller() frame walk;
+# formatters below identify the source by logger name instead.
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
+# Logs directory; created by setup_logging() rather than at import time
 log_dir = Path("logs")
-log_dir.mkdir(exist_ok=True)
 
 # Logging configuration
 LOGGING_CONFIG = {
@@ -16,14 +27,16 @@ LOGGING_CONFIG = {
     "disable_existing_loggers": False,
     "formatters": {
         "detailed": {
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(module)s:%(lineno)d - %(message)s",
+            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
         "simple": {
             "format": "%(levelname)s - %(message)s",
         },
         "json": {
-            "format": '{"time": "%(asctime)s", "level": "%(levelname)s", "logger": "%(name)s", "module": "%(module)s", "line": %(lineno)d, "message": "%(message)s"}',
+            "()": "pythonjsonlogger.orjson.OrjsonFormatter",
+            "format": "%(asctime)s %(levelname)s %(name)s %(message)s",
+            "rename_fields": {"asctime": "time", "levelname": "level", "name": "logger"},
             "datefmt": "%Y-%m-%d %H:%M:%S",
         },
     },
@@ -77,6 +90,56 @@ LOGGING_CONFIG = {
     },
 }
 
+# Background listeners that own the file handlers (see _queue_file_handlers)
+_listeners = []
+
+
+def _stop_listeners():
+    """Flush and stop any running queue listeners."""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+atexit.register(_stop_listeners)
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves exception formatting to the listener thread.
+    The stock prepare() formats the record, rendering exc_info into the message,
+    on the logging thread; the queue never leaves this process, so the record
+    can carry exc_info across as-is and only the %-args are merged here.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _queue_file_handlers():
+    """
+    Move file handlers behind QueueHandlers so log writes and rotations run
+    on a background thread instead of the request thread / event loop.
+    """
+    replacements = {}
+    for name in LOGGING_CONFIG["loggers"]:
+        target = logging.getLogger(name or None)
+        for handler in list(target.handlers):
+            if not isinstance(handler, logging.handlers.RotatingFileHandler):
+                continue
+            if handler not in replacements:
+                log_queue = queue.SimpleQueue()
+                listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+                listener.start()
+                _listeners.append(listener)
+                queue_handler = _DeferredQueueHandler(log_queue)
+                queue_handler.setLevel(handler.level)
+                replacements[handler] = queue_handler
+            target.removeHandler(handler)
+            target.addHandler(replacements[handler])
+
 
 def setup_logging(log_level: str = "INFO"):
     """
@@ -90,8 +153,13 @@ def setup_logging(log_level: str = "INFO"):
     LOGGING_CONFIG["loggers"][""]["level"] = log_level
     LOGGING_CONFIG["loggers"]["app"]["level"] = log_level
     
+    # Create logs directory if it doesn't exist (single mkdir, no exists() check)
+    log_dir.mkdir(exist_ok=True)
+
     # Apply configuration
+    _stop_listeners()
     logging.config.dictConfig(LOGGING_CONFIG)
+    _queue_file_handlers()
     
     # Log startup message
     logger = logging.getLogger("app.startup")
@@ -110,8 +178,6 @@ def get_logger(name: str = None) -> logging.Logger:
         Logger instance
     """
     if name is None:
-        import inspect
-        frame = inspect.currentframe().f_back
-        name = frame.f_globals.get('__name__', 'unknown')
+        name = sys._getframe(1).f_globals.get('__name__', 'unknown')
     
     return logging.getLogger(name)
\ No newline at end of file
@@ -1,11 +1,19 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, Tuple
+import asyncio
+import importlib
+import importlib.util
 import logging
 import os
+import orjson
+import re
+import time
 from pathlib import Path
-from datetime import datetime
 
 # Load environment variables from .env file
 from dotenv import load_dotenv
@@ -21,197 +29,392 @@ from .exceptions import (
     validation_exception_handler,
     general_exception_handler
 )
-from .routers import search, graph, summarize, export, azure_ai
-# Skip integrations router temporarily - requires optional dependencies
-# from .routers import integrations
+from .utils import utc_timestamp
+from .services.cache import response_cache
 from .services.neo4j_client import neo4j_client
-from .services.milvus_client import milvus_client
+from .services.milvus_client import MockMilvusClient, milvus_client
+
+try:
+    from pymilvus import Collection, utility
+except ImportError:  # Optional: Milvus probes then report the error in /stats
+    Collection = None
+    utility = None
 
 # Setup logging
 setup_logging(settings.log_level)
 logger = get_logger(__name__)
 
+
+def _warm_milvus():
+    """Issue a trivial query so the Milvus channel is set up before traffic."""
+    collection = getattr(milvus_client, "collection", None)
+    if getattr(milvus_client, "connected", False) and collection is not None:
+        collection.query(expr="", limit=1, output_fields=["id"])
+
+
+async def _warm_connection_pools():
+    """Open Neo4j sessions and Milvus channels up front so first requests find them hot."""
+    warmups = []
+    if neo4j_client.connected:
+        warmups += [asyncio.to_thread(neo4j_client.run_query, "RETURN 1") for _ in range(settings.neo4j_pool_min)]
+        warmups += [neo4j_client.arun_query("RETURN 1") for _ in range(settings.neo4j_pool_min)]
+    warmups += [asyncio.to_thread(_warm_milvus) for _ in range(settings.milvus_pool_min)]
+
+    for result in await asyncio.gather(*warmups, return_exceptions=True):
+        if isinstance(result, Exception):
+            logger.warning(f"Connection pool warm-up failed: {result}")
+
+
+async def startup_event():
+    """Initialize read-only database connections on startup."""
+    logger.info("Starting BioNexus Read-Only API...")
+
+    # Connect Neo4j Aura, Milvus Cloud and the Redis response cache concurrently (read-only)
+    results = await asyncio.gather(
+        asyncio.to_thread(neo4j_client.connect),
+        asyncio.to_thread(milvus_client.connect),
+        response_cache.connect(),
+        return_exceptions=True
+    )
+    errors = [r for r in results if isinstance(r, Exception)]
+    for error in errors:
+        logger.error(f"Startup failed: {error}")
+
+    if neo4j_client.connected:
+        logger.info("Neo4j Aura connection verified")
+    else:
+        logger.warning("Neo4j Aura connection test failed")
+    if getattr(milvus_client, "connected", True):
+        logger.info("Milvus Cloud connection verified")
+
+    # Don't raise in production - allow graceful degradation
+    if errors and settings.environment == "development":
+        raise errors[0]
+
+    # Production data is read-only and pre-indexed; in development make sure the
+    # indexes behind the export ORDER BYs (Publication.year, Entity type/name) exist
+    if neo4j_client.connected and settings.environment == "development":
+        await asyncio.to_thread(neo4j_client.create_constraints)
+
+    await _warm_connection_pools()
+
+    logger.info("BioNexus Read-Only API startup complete")
+
+
+async def shutdown_event():
+    """Cleanup on shutdown."""
+    try:
+        await neo4j_client.aclose()
+        milvus_client.disconnect()
+        await response_cache.close()
+        logger.info("BioNexus API shutdown complete")
+    except Exception as e:
+        logger.error(f"Shutdown error: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup/shutdown hooks around the application's lifetime."""
+    await startup_event()
+    yield
+    await shutdown_event()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="BioNexus API",
     description="Read-only AI-powered knowledge graph platform for NASA bioscience publications",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
+# All configured origins, including wildcard entries such as "https://*.run.app",
+# are compiled once into a single allow_origin_regex so origin checks are one match.
+def _cors_origin_regex(origins) -> Optional[str]:
+    patterns = [
+        re.escape(origin).replace(r"\*", r"[a-z0-9-]+(?:\.[a-z0-9-]+)*")
+        for origin in origins
+    ]
+    return f"(?:{'|'.join(patterns)})" if patterns else None
+
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=[],
+    allow_origin_regex=_cors_origin_regex(settings.cors_origins),
     allow_credentials=True,
     allow_methods=["GET", "POST"],  # Only read operations
-    allow_headers=["*"],
+    allow_headers=["Content-Type", "Authorization"],  # Headers the frontend sends
 )
 
+# Compress larger responses (exports, graph payloads); streamed CSV is compressed chunk by chunk.
+# Level 1 keeps the per-chunk CPU cost low and compresses CSV/JSON nearly as well.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Add exception handlers
 app.add_exception_handler(BioNexusException, bionexus_exception_handler)
 app.add_exception_handler(HTTPException, http_exception_handler)
 app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.add_exception_handler(Exception, general_exception_handler)
 
-# Include routers (read-only operations only)
-app.include_router(search.router, prefix="/search", tags=["search"])
-app.include_router(graph.router, prefix="/graph", tags=["knowledge-graph"])
-app.include_router(summarize.router, prefix="/summarize", tags=["summarization"])
-# Skip integrations router temporarily - requires optional dependencies
-# app.include_router(integrations.router, prefix="/integrations", tags=["external-integrations"])
+# Include routers (read-only operations only): (module, prefix, tags, required modules).
+# Routers whose optional dependencies are not installed are skipped without importing them.
+_ROUTES = [
+    ("search", "/search", ["search"], ()),
+    ("graph", "/graph", ["knowledge-graph"], ()),
+    ("summarize", "/summarize", ["summarization"], ("openai",)),
+    ("integrations", "/integrations", ["external-integrations"], ("aiohttp",)),
+    ("azure_ai", "", ["azure-ai"], ("azure.ai.textanalytics", "azure.cognitiveservices.vision.computervision")),
+    ("export", "/export", ["data-export"], ()),
+]
 
-# Azure AI services
-app.include_router(azure_ai.router, tags=["azure-ai"])
 
-app.include_router(export.router, prefix="/export", tags=["data-export"])
+def _has_modules(names) -> bool:
+    """Check that every module is importable without importing it"""
+    for name in names:
+        try:
+            if importlib.util.find_spec(name) is None:
+                return False
+        except ModuleNotFoundError:
+            # Parent package of a dotted name is missing
+            return False
+    return True
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize read-only database connections on startup."""
+for _name, _prefix, _tags, _requires in _ROUTES:
+    if not _has_modules(_requires):
+        logger.warning(f"Skipping {_name} router - missing optional dependencies: {', '.join(_requires)}")
+        continue
+    _module = importlib.import_module(f".routers.{_name}", __package__)
+    app.include_router(_module.router, prefix=_prefix, tags=_tags)
+
+
+# The root payload is fully static, so serialize it once at import
+_ROOT_BYTES = orjson.dumps({
+    "name": "BioNexus Read-Only API",
+    "version": "1.0.0",
+    "description": "Read-only AI-powered knowledge graph platform for pre-processed NASA bioscience publications",
+    "data_source": "Pre-processed data from Neo4j Aura and Milvus Cloud",
+    "endpoints": {
+        "search": "/search/*", 
+        "knowledge_graph": "/graph/*",
+        "summarization": "/summarize/*",
+        "integrations": "/integrations/*",
+
+        "data_export": "/export/*",
+        "documentation": "/docs"
+    },
+    "status": "running",
+    "mode": "read_only"
+})
+
+
+@app.get("/")
+async def root():
+    """Root endpoint with API information."""
+    return Response(_ROOT_BYTES, media_type="application/json")
+
+
+# Short-lived cache for /health and /stats so probe storms share one round-trip
+_stats_cache = {"ts": 0.0, "data": None}
+_stats_lock = asyncio.Lock()
+
+
+_NEO4J_COUNTS_APOC_QUERY = """
+CALL apoc.meta.stats() YIELD nodeCount, labels
+RETURN nodeCount AS node_count,
+       labels['Publication'] AS publication_count,
+       labels['Page'] AS page_count,
+       labels['Entity'] AS entity_count
+"""
+
+_apoc_state = {"available": True}
+
+# Fallback when APOC is missing. Kept as a constant literal so Neo4j compiles
+# it once and reuses the cached plan. Static labels let the planner answer
+# each COUNT {} from the count store. A `$label IN labels(n)` template would
+# turn every count into a full node scan.
+_NEO4J_COUNTS_QUERY = """
+RETURN COUNT { MATCH (n) } AS node_count,
+       COUNT { MATCH (p:Publication) } AS publication_count,
+       COUNT { MATCH (pg:Page) } AS page_count,
+       COUNT { MATCH (e:Entity) } AS entity_count
+"""
+
+
+def _probe_neo4j() -> Dict[str, Any]:
+    """Fetch Neo4j label counts (blocking)."""
+    neo4j_stats = {}
     try:
-        logger.info("Starting BioNexus Read-Only API...")
-        
-        # Test Neo4j Aura connection (read-only)
-        test_result = neo4j_client.run_query("RETURN 1 as test LIMIT 1")
-        if test_result:
-            logger.info("Neo4j Aura connection verified")
-        else:
-            logger.warning("Neo4j Aura connection test failed")
-        
-        # Test Milvus Cloud connection (read-only)
-        milvus_client.connect()
-        logger.info("Milvus Cloud connection verified")
-        
-        logger.info("BioNexus Read-Only API startup complete")
-        
+        # All label counts in one round-trip, served from the count store
+        count_result = None
+        if _apoc_state["available"]:
+            try:
+                count_result = neo4j_client.run_query(_NEO4J_COUNTS_APOC_QUERY)
+            except Exception:
+                # APOC not installed - use COUNT {} subqueries from now on
+                _apoc_state["available"] = False
+        if count_result is None:
+            count_result = neo4j_client.run_query(_NEO4J_COUNTS_QUERY)
+        counts = count_result[0] if count_result else {}
+        for key in ('node_count', 'publication_count', 'page_count', 'entity_count'):
+            neo4j_stats[key] = counts.get(key) or 0
     except Exception as e:
-        logger.error(f"Startup failed: {e}")
-        # Don't raise in production - allow graceful degradation
-        if settings.environment == "development":
-            raise
+        logger.error(f"Neo4j stats error: {e}")
+        neo4j_stats = {'error': str(e)}
+    return neo4j_stats
 
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Cleanup on shutdown."""
+# Collection handles built by the probe; constructing one costs a describe_collection RPC
+_milvus_collections: Dict[str, Any] = {}
+
+
+def _embeddings_collection():
+    """Return a long-lived handle to the embeddings collection."""
+    collection = getattr(milvus_client, "collection", None)
+    if collection is not None and collection.name == 'bionexus_embeddings':
+        return collection
+    if 'bionexus_embeddings' not in _milvus_collections:
+        _milvus_collections['bionexus_embeddings'] = Collection('bionexus_embeddings')
+    return _milvus_collections['bionexus_embeddings']
+
+
+def _probe_milvus() -> Dict[str, Any]:
+    """Fetch Milvus collection stats (blocking)."""
+    milvus_stats = {}
     try:
-        neo4j_client.close()
-        milvus_client.disconnect()
-        logger.info("BioNexus API shutdown complete")
+        # Get collection info - use utility module
+        if utility is None:
+            raise RuntimeError("pymilvus is not installed")
+        collections = utility.list_collections()
+        milvus_stats['collections'] = collections
+        if 'bionexus_embeddings' in collections:
+            milvus_stats['vector_count'] = _embeddings_collection().num_entities
     except Exception as e:
-        logger.error(f"Shutdown error: {e}")
+        logger.error(f"Milvus stats error: {e}")
+        milvus_stats = {'error': str(e)}
+    return milvus_stats
 
 
-@app.get("/")
-async def root():
-    """Root endpoint with API information."""
-    return {
-        "name": "BioNexus Read-Only API",
-        "version": "1.0.0",
-        "description": "Read-only AI-powered knowledge graph platform for pre-processed NASA bioscience publications",
-        "data_source": "Pre-processed data from Neo4j Aura and Milvus Cloud",
-        "endpoints": {
-            "search": "/search/*", 
-            "knowledge_graph": "/graph/*",
-            "summarization": "/summarize/*",
-            "integrations": "/integrations/*",
-
-            "data_export": "/export/*",
-            "documentation": "/docs"
-        },
-        "status": "running",
-        "mode": "read_only"
-    }
+async def _collect_stats() -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Return (neo4j_stats, milvus_stats), probing at most once per TTL."""
+    if _stats_cache["data"] is not None and time.monotonic() - _stats_cache["ts"] < settings.health_ttl_seconds:
+        return _stats_cache["data"]
+
+    async with _stats_lock:
+        # Another request may have refreshed the cache while we waited
+        if _stats_cache["data"] is None or time.monotonic() - _stats_cache["ts"] >= settings.health_ttl_seconds:
+            _stats_cache["data"] = tuple(await asyncio.gather(
+                asyncio.to_thread(_probe_neo4j),
+                asyncio.to_thread(_probe_milvus)
+            ))
+            _stats_cache["ts"] = time.monotonic()
+        return _stats_cache["data"]
+
+
+# Liveness: no I/O, safe for frequent orchestrator probes (k8s livenessProbe,
+# container HEALTHCHECK). Readiness probes may keep using the TTL-cached /health.
+@app.get("/healthz")
+async def healthz():
+    """Liveness check endpoint."""
+    return {"status": "ok"}
+
+
+@app.get("/healthz/pool")
+async def healthz_pool():
+    """Neo4j connection pool usage for this worker (no I/O)."""
+    return neo4j_client.pool_stats()
 
 
 @app.get("/health")
-async def health_check():
-    """Health check endpoint."""
+async def health_check(response: Response):
+    """Health check endpoint. Responds 503 when a backing store is down so load balancers drain the pod."""
+    now_iso = utc_timestamp()
     try:
-        # Get Neo4j stats
-        neo4j_stats = {}
-        try:
-            # Count nodes
-            node_result = neo4j_client.run_query("MATCH (n) RETURN count(n) as count")
-            neo4j_stats['node_count'] = node_result[0]['count'] if node_result else 0
-            
-            # Count publications
-            pub_result = neo4j_client.run_query("MATCH (p:Publication) RETURN count(p) as count")
-            neo4j_stats['publication_count'] = pub_result[0]['count'] if pub_result else 0
-            
-            # Count pages
-            page_result = neo4j_client.run_query("MATCH (pg:Page) RETURN count(pg) as count")
-            neo4j_stats['page_count'] = page_result[0]['count'] if page_result else 0
-            
-            # Count entities
-            entity_result = neo4j_client.run_query("MATCH (e:Entity) RETURN count(e) as count")
-            neo4j_stats['entity_count'] = entity_result[0]['count'] if entity_result else 0
-        except Exception as e:
-            logger.error(f"Neo4j stats error: {e}")
-            neo4j_stats = {'error': str(e)}
-        
-        # Get Milvus stats
-        milvus_stats = {}
-        try:
-            # Get collection info - use utility module
-            from pymilvus import utility
-            collections = utility.list_collections()
-            milvus_stats['collections'] = collections
-            if 'bionexus_embeddings' in collections:
-                from pymilvus import Collection
-                collection = Collection('bionexus_embeddings')
-                milvus_stats['vector_count'] = collection.num_entities
-        except Exception as e:
-            logger.error(f"Milvus stats error: {e}")
-            milvus_stats = {'error': str(e)}
-        
+        neo4j_stats, milvus_stats = await _collect_stats()
+
+        services = {
+            "neo4j": "unhealthy" if 'error' in neo4j_stats else "healthy",
+            "milvus": "unhealthy" if 'error' in milvus_stats else "healthy",
+            "api": "healthy"
+        }
+        # The mock client stands in when Milvus is not configured; don't fail readiness on it
+        if isinstance(milvus_client, MockMilvusClient):
+            services["milvus"] = "not_configured"
+
+        healthy = "unhealthy" not in services.values()
+        if not healthy:
+            response.status_code = 503
+
         return {
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "services": {
-                "neo4j": "healthy",
-                "milvus": "healthy",
-                "api": "healthy"
-            },
+            "status": "healthy" if healthy else "unhealthy",
+            "timestamp": now_iso,
+            "services": services,
             "neo4j_stats": neo4j_stats,
             "milvus_stats": milvus_stats
         }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
+        response.status_code = 503
         return {
             "status": "unhealthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso,
             "error": str(e)
         }
 
 
+# Labels and relationship types in one round-trip
+_DEBUG_SCHEMA_QUERY = """
+CALL db.labels() YIELD label
+WITH collect(label) AS labels
+CALL {
+    CALL db.relationshipTypes() YIELD relationshipType
+    RETURN collect(relationshipType) AS relationship_types
+}
+RETURN labels, relationship_types
+"""
+
+
+def _label_samples_query(labels) -> str:
+    """
+    Up to 3 sample nodes for each label in a second round-trip. Labels cannot be
+    parameters, so each branch names its label (backtick-escaped) and plans as a
+    label scan; the label itself comes back from $labels.
+    """
+    return "\nUNION ALL\n".join(
+        f"MATCH (n:`{label.replace('`', '``')}`) WITH n LIMIT 3 "
+        f"RETURN $labels[{i}] AS label, collect(n) AS nodes"
+        for i, label in enumerate(labels)
+    )
+
+
 @app.get("/debug/schema")
 async def debug_schema():
     """Debug endpoint to see what's actually in the database."""
     try:
-        # Get all node labels
-        labels_query = "CALL db.labels() YIELD label RETURN label"
-        labels = neo4j_client.run_query(labels_query)
-        
-        # Get sample nodes for each label
+        rows = await neo4j_client.arun_query(_DEBUG_SCHEMA_QUERY)
+
+        if not rows:
+            return {"node_labels": [], "sample_nodes": {}, "relationship_types": []}
+
+        labels = rows[0]['labels']
+        sampled = labels[:5]
         samples = {}
-        for label_row in labels[:5]:  # Limit to first 5 labels
-            label = label_row['label']
-            sample_query = f"MATCH (n:{label}) RETURN n LIMIT 3"
-            sample_nodes = neo4j_client.run_query(sample_query)
-            samples[label] = sample_nodes
-        
-        # Get relationship types
-        rel_query = "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
-        relationships = neo4j_client.run_query(rel_query)
-        
+        if sampled:
+            sample_rows = await neo4j_client.arun_query(_label_samples_query(sampled), {"labels": sampled})
+            samples = {
+                row['label']: [{"n": node} for node in row['nodes']]
+                for row in sample_rows
+            }
+
         return {
-            "node_labels": [l['label'] for l in labels],
+            "node_labels": labels,
             "sample_nodes": samples,
-            "relationship_types": [r['relationshipType'] for r in relationships]
+            "relationship_types": rows[0]['relationship_types']
         }
     except Exception as e:
         logger.error(f"Debug schema failed: {e}")
@@ -221,12 +424,10 @@ async def debug_schema():
 @app.get("/stats")
 async def get_stats():
     """Get database statistics for dashboard."""
+    now_iso = utc_timestamp()
     try:
-        # Get stats from health endpoint but format for frontend
-        health_data = await health_check()
-        
-        neo4j_stats = health_data.get('neo4j_stats', {})
-        milvus_stats = health_data.get('milvus_stats', {})
+        # Shares the cached probe with /health, formatted for the frontend
+        neo4j_stats, milvus_stats = await _collect_stats()
         
         return {
             "publications": neo4j_stats.get('publication_count', 0),
@@ -234,7 +435,7 @@ async def get_stats():
             "entities": neo4j_stats.get('entity_count', 0),
             "searchIndexSize": milvus_stats.get('vector_count', 0),
             "totalNodes": neo4j_stats.get('node_count', 0),
-            "lastUpdated": datetime.now().isoformat()
+            "lastUpdated": now_iso
         }
     except Exception as e:
         logger.error(f"Stats endpoint failed: {e}")
@@ -245,85 +446,15 @@ async def get_stats():
             "entities": 0,
             "searchIndexSize": 0,
             "totalNodes": 0,
-            "lastUpdated": datetime.now().isoformat(),
+            "lastUpdated": now_iso,
             "error": "Database unavailable - showing actual zeros"
         }
 
 
-# Export routes
-@app.get("/export/entities")
-async def export_entities(format: str = "json"):
-    """Export all entities in specified format."""
-    try:
-        if format not in ["json", "csv"]:
-            raise HTTPException(status_code=400, detail="Format must be 'json' or 'csv'")
-        
-        entities_query = """
-        MATCH (e:Entity)
-        RETURN e.entity_id as entity_id, e.name as name, e.entity_type as type,
-               e.canonical_id as canonical_id, e.confidence as confidence
-        ORDER BY e.entity_type, e.name
-        """
-        
-        entities = neo4j_client.run_query(entities_query)
-        
-        if format == "json":
-            return {"entities": entities, "count": len(entities)}
-        else:  # CSV
-            import csv
-            import io
-            
-            output = io.StringIO()
-            if entities:
-                writer = csv.DictWriter(output, fieldnames=entities[0].keys())
-                writer.writeheader()
-                writer.writerows(entities)
-            
-            return {"csv_data": output.getvalue(), "count": len(entities)}
-        
-    except Exception as e:
-        logger.error(f"Entity export failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Export failed: {e}")
-
-
-@app.get("/export/publications")
-async def export_publications(format: str = "json"):
-    """Export all publications in specified format."""
-    try:
-        if format not in ["json", "csv"]:
-            raise HTTPException(status_code=400, detail="Format must be 'json' or 'csv'")
-        
-        pubs_query = """
-        MATCH (p:Publication)
-        RETURN p.pub_id as pub_id, p.title as title, p.authors as authors,
-               p.year as year, p.journal as journal, p.doi as doi,
-               p.total_pages as total_pages
-        ORDER BY p.year DESC, p.title
-        """
-        
-        publications = neo4j_client.run_query(pubs_query)
-        
-        if format == "json":
-            return {"publications": publications, "count": len(publications)}
-        else:  # CSV  
-            import csv
-            import io
-            
-            output = io.StringIO()
-            if publications:
-                # Flatten authors array for CSV
-                for pub in publications:
-                    pub['authors'] = '; '.join(pub.get('authors', []))
-                
-                writer = csv.DictWriter(output, fieldnames=publications[0].keys())
-                writer.writeheader()
-                writer.writerows(publications)
-            
-            return {"csv_data": output.getvalue(), "count": len(publications)}
-        
-    except Exception as e:
-        logger.error(f"Publication export failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Export failed: {e}")
+@app.get("/meta/cache-stats")
+async def get_cache_stats():
+    """Response cache hit/miss counters for this worker."""
+    return response_cache.stats()
 
 
 if __name__ == "__main__":
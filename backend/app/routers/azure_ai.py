@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 import logging
+import time
 
 # Import the Azure AI service
 from app.services.azure_ai_service import AzureAIService
@@ -10,8 +12,90 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/azure", tags=["Azure AI"])
 
-# Initialize Azure service
-azure_service = AzureAIService()
+@lru_cache(maxsize=1)
+def get_azure_service() -> AzureAIService:
+    """Create the Azure service on first use and share it across requests"""
+    return AzureAIService()
+
+
+# Azure configuration only changes on redeploy, so the health answer is reused
+_AZURE_HEALTH_TTL = 30.0
+_azure_health_cache = {"ts": 0.0, "data": None}
+
+
+def _compute_azure_health(svc: AzureAIService) -> Dict[str, Any]:
+    """Check Azure AI services connectivity and configuration"""
+    try:
+        # Check if Azure services are properly configured
+        has_text_analytics = hasattr(svc, 'text_client')
+        has_computer_vision = hasattr(svc, 'vision_client')
+        
+        return {
+            "status": "healthy",
+            "services": {
+                "text_analytics": "configured" if has_text_analytics else "not_configured",
+                "computer_vision": "configured" if has_computer_vision else "not_configured"
+            },
+            "azure_integration": "active",
+            "ready_for_production": has_text_analytics and has_computer_vision
+        }
+        
+    except Exception as e:
+        logger.error(f"Azure health check failed: {e}")
+        return {
+            "status": "unhealthy",
+            "error": str(e),
+            "azure_integration": "error"
+        }
+
+
+def _cached_azure_health(svc: AzureAIService) -> Dict[str, Any]:
+    """Return the Azure health payload, recomputed at most once per TTL"""
+    now = time.monotonic()
+    if _azure_health_cache["data"] is None or now - _azure_health_cache["ts"] >= _AZURE_HEALTH_TTL:
+        _azure_health_cache["data"] = _compute_azure_health(svc)
+        _azure_health_cache["ts"] = now
+    return _azure_health_cache["data"]
+
+
+def _require_azure(svc: AzureAIService, service: str) -> None:
+    """Fail fast with 503 when the cached health says an Azure service is unusable"""
+    health = _cached_azure_health(svc)
+    if health.get("services", {}).get(service) != "configured":
+        raise HTTPException(status_code=503, detail="Azure unavailable")
+
+
+# Static feature catalogue served by /azure/capabilities
+_AZURE_CAPS = {
+    "available_features": {
+        "enhanced_biomedical_ner": {
+            "description": "Advanced biomedical entity recognition combining Azure + SciSpacy",
+            "input": "Research text",
+            "output": "Entities with confidence scores and source attribution",
+            "use_cases": ["Literature review", "Knowledge graph enrichment", "Research analysis"]
+        },
+        "research_sentiment_analysis": {
+            "description": "Sentiment analysis optimized for scientific literature",
+            "input": "Research text",
+            "output": "Sentiment scores, key phrases, research indicators",
+            "use_cases": ["Publication analysis", "Research trend detection", "Content categorization"]
+        },
+        "research_image_analysis": {
+            "description": "Computer vision for scientific images and documents",
+            "input": "Image URL",
+            "output": "Chart analysis, OCR text, methodology detection",
+            "use_cases": ["Document digitization", "Chart data extraction", "Research methodology identification"]
+        }
+    },
+    "integration_status": "ready",
+    "supported_domains": [
+        "Biomedical research",
+        "Life sciences",
+        "Clinical studies",
+        "Scientific publications",
+        "Research methodology"
+    ]
+}
 
 class TextAnalysisRequest(BaseModel):
     text: str
@@ -20,15 +104,17 @@ class ImageAnalysisRequest(BaseModel):
     image_url: str
 
 @router.post("/analyze-biomedical-text")
-async def analyze_biomedical_text(request: TextAnalysisRequest):
+async def analyze_biomedical_text(request: TextAnalysisRequest, svc: AzureAIService = Depends(get_azure_service)):
     """
     Enhanced biomedical Named Entity Recognition using Azure Text Analytics + SciSpacy
     
     Combines Azure's powerful text analytics with specialized biomedical models
     for comprehensive entity extraction from research texts.
     """
+    _require_azure(svc, "text_analytics")
+
     try:
-        result = await azure_service.enhanced_biomedical_ner(request.text)
+        result = await svc.enhanced_biomedical_ner(request.text)
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
@@ -45,15 +131,17 @@ async def analyze_biomedical_text(request: TextAnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 @router.post("/analyze-sentiment")
-async def analyze_research_sentiment(request: TextAnalysisRequest):
+async def analyze_research_sentiment(request: TextAnalysisRequest, svc: AzureAIService = Depends(get_azure_service)):
     """
     Analyze sentiment and extract key phrases from research text
     
     Provides detailed sentiment analysis optimized for scientific literature,
     including research-specific indicators and confidence scoring.
     """
+    _require_azure(svc, "text_analytics")
+
     try:
-        result = await azure_service.sentiment_analysis_research_text(request.text)
+        result = await svc.sentiment_analysis_research_text(request.text)
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
@@ -70,15 +158,17 @@ async def analyze_research_sentiment(request: TextAnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Sentiment analysis failed: {str(e)}")
 
 @router.post("/analyze-image")
-async def analyze_research_image(request: ImageAnalysisRequest):
+async def analyze_research_image(request: ImageAnalysisRequest, svc: AzureAIService = Depends(get_azure_service)):
     """
     Analyze research document images (charts, diagrams, microscopy images)
     
     Uses Azure Computer Vision to extract insights from scientific images,
     including chart analysis, OCR for text extraction, and research methodology detection.
     """
+    _require_azure(svc, "computer_vision")
+
     try:
-        result = await azure_service.analyze_research_document_images(request.image_url)
+        result = await svc.analyze_research_document_images(request.image_url)
         
         if "error" in result:
             raise HTTPException(status_code=500, detail=result["error"])
@@ -95,65 +185,15 @@ async def analyze_research_image(request: ImageAnalysisRequest):
         raise HTTPException(status_code=500, detail=f"Image analysis failed: {str(e)}")
 
 @router.get("/health")
-async def azure_health_check():
+async def azure_health_check(svc: AzureAIService = Depends(get_azure_service)):
     """
     Check Azure AI services connectivity and configuration
     """
-    try:
-        # Check if Azure services are properly configured
-        has_text_analytics = hasattr(azure_service, 'text_client')
-        has_computer_vision = hasattr(azure_service, 'vision_client')
-        
-        return {
-            "status": "healthy",
-            "services": {
-                "text_analytics": "configured" if has_text_analytics else "not_configured",
-                "computer_vision": "configured" if has_computer_vision else "not_configured"
-            },
-            "azure_integration": "active",
-            "ready_for_production": has_text_analytics and has_computer_vision
-        }
-        
-    except Exception as e:
-        logger.error(f"Azure health check failed: {e}")
-        return {
-            "status": "unhealthy",
-            "error": str(e),
-            "azure_integration": "error"
-        }
+    return _cached_azure_health(svc)
 
 @router.get("/capabilities")
 async def get_azure_capabilities():
     """
     Get available Azure AI capabilities and feature descriptions
     """
-    return {
-        "available_features": {
-            "enhanced_biomedical_ner": {
-                "description": "Advanced biomedical entity recognition combining Azure + SciSpacy",
-                "input": "Research text",
-                "output": "Entities with confidence scores and source attribution",
-                "use_cases": ["Literature review", "Knowledge graph enrichment", "Research analysis"]
-            },
-            "research_sentiment_analysis": {
-                "description": "Sentiment analysis optimized for scientific literature",
-                "input": "Research text",
-                "output": "Sentiment scores, key phrases, research indicators",
-                "use_cases": ["Publication analysis", "Research trend detection", "Content categorization"]
-            },
-            "research_image_analysis": {
-                "description": "Computer vision for scientific images and documents",
-                "input": "Image URL",
-                "output": "Chart analysis, OCR text, methodology detection",
-                "use_cases": ["Document digitization", "Chart data extraction", "Research methodology identification"]
-            }
-        },
-        "integration_status": "ready",
-        "supported_domains": [
-            "Biomedical research",
-            "Life sciences",
-            "Clinical studies",
-            "Scientific publications",
-            "Research methodology"
-        ]
-    }
\ No newline at end of file
+    return _AZURE_CAPS
@@ -1,179 +1,543 @@
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, StreamingResponse
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import List, Dict, Any, AsyncIterator, Callable, Iterator, Optional, Tuple
+import asyncio
+import gzip
+import hashlib
+import hmac
+import itertools
 import logging
-from datetime import datetime
-import json
+import orjson
+import time
+from collections import OrderedDict
 import csv
 import io
 import tempfile
 import os
+import uuid
 
+from ..config import settings
+from ..services.cache import response_cache
 from ..services.neo4j_client import neo4j_client
+from .graph import clear_local_cache
+from ..utils import json_dumps, json_response, utc_timestamp
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
-class ExportRequest(BaseModel):
-    formats: List[str]
-    include_metadata: bool = True
-    date_range: Optional[Dict[str, str]] = None
+# Finished export bodies keyed by endpoint + parameters:
+# key -> (expires_at, body, gzipped body or None, media_type, headers). Responses
+# are rebuilt per hit because middleware mutates response headers in place.
+_EXPORT_CACHE_MAX = 128
+_export_cache: "OrderedDict[bytes, Tuple[float, bytes, Optional[bytes], str, Dict[str, str]]]" = OrderedDict()
+_export_locks: Dict[bytes, asyncio.Lock] = {}
 
+# Cached bodies are compressed once at a higher level than the per-response
+# GZipMiddleware uses; responses that already carry Content-Encoding pass through it
+_GZIP_MIN_SIZE = 1024
+_GZIP_CACHED_LEVEL = 6
 
-class ExportStatus(BaseModel):
-    export_id: str
-    status: str
-    progress: float
-    created_at: datetime
-    file_size: Optional[int] = None
-    download_url: Optional[str] = None
+
+def _export_cache_key(endpoint: str, params: Dict[str, Any]) -> bytes:
+    return hashlib.blake2b(
+        orjson.dumps({"ep": endpoint, "p": params}, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).digest()
+
+
+def _cached_entry(key: bytes) -> Optional[Tuple[float, bytes, Optional[bytes], str, Dict[str, str]]]:
+    entry = _export_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    _export_cache.move_to_end(key)
+    return entry
+
+
+def _build_and_compress(build: Callable[[], Response]) -> Tuple[Response, Optional[bytes]]:
+    built = build()
+    gzipped = gzip.compress(built.body, _GZIP_CACHED_LEVEL) if len(built.body) >= _GZIP_MIN_SIZE else None
+    return built, gzipped
+
+
+async def _cached_export(
+    request: Request,
+    endpoint: str,
+    params: Dict[str, Any],
+    build: Callable[[], Response]
+) -> Response:
+    """
+    Serve an export body from the in-process cache, building it in a worker
+    thread on a miss. Concurrent misses for the same key wait for one build.
+    Responses carry an ETag so clients can revalidate with If-None-Match, and
+    gzip-capable clients get the pre-compressed body.
+    """
+    key = _export_cache_key(endpoint, params)
+    entry = _cached_entry(key)
+    if entry is None:
+        lock = _export_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = _cached_entry(key)
+            if entry is None:
+                built, gzipped = await asyncio.to_thread(_build_and_compress, build)
+                ttl = settings.export_cache_ttl
+                headers = {
+                    k: v for k, v in built.headers.items()
+                    if k not in ("content-length", "content-type")
+                }
+                headers["ETag"] = f'"{hashlib.blake2b(built.body, digest_size=16).hexdigest()}"'
+                headers["Cache-Control"] = f"max-age={ttl}"
+                headers["Vary"] = "Accept-Encoding"
+                entry = (time.monotonic() + ttl, built.body, gzipped, built.media_type, headers)
+                _export_cache[key] = entry
+                while len(_export_cache) > _EXPORT_CACHE_MAX:
+                    _export_cache.popitem(last=False)
+        _export_locks.pop(key, None)
+
+    _, body, gzipped, media_type, headers = entry
+    use_gzip = gzipped is not None and "gzip" in request.headers.get("accept-encoding", "")
+    if use_gzip:
+        # Distinct validator for the encoded representation
+        headers = {**headers, "ETag": headers["ETag"][:-1] + '-gzip"', "Content-Encoding": "gzip"}
+        body = gzipped
+
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers={"ETag": headers["ETag"], "Cache-Control": headers["Cache-Control"]})
+    return Response(body, media_type=media_type, headers=headers)
+
+
+# Rendered CSV is handed to the response in chunks of about this many characters
+# rather than per row, so sync iterators cost one threadpool hop per chunk.
+_CSV_CHUNK_CHARS = 1 << 16
+
+
+class _CSVRows:
+    """
+    Render dict records as CSV lines one row at a time, header taken from the first record.
+    Rows are written positionally: every record comes from the same Cypher RETURN
+    clause, so key order is fixed and the DictWriter per-field lookups are avoided.
+    
+    Most rows (ids, numbers, plain names) need no quoting, so they are joined
+    directly; csv.writer only runs for rows containing a quote, newline or
+    the delimiter inside a value.
+    """
+
+    def __init__(self, delimiter: str = ","):
+        self.delimiter = delimiter
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer, delimiter=delimiter)
+        self.header_written = False
+
+    def _row(self, values: Any) -> str:
+        fields = ["" if v is None else v if type(v) is str else str(v) for v in values]
+        line = self.delimiter.join(fields)
+        # One C-level scan per row decides whether any field would need quoting
+        if (
+            len(fields) > 1
+            and line.count(self.delimiter) == len(fields) - 1
+            and '"' not in line and "\n" not in line and "\r" not in line
+        ):
+            return line + "\r\n"
+        self.writer.writerow(values)
+        line = self.buffer.getvalue()
+        self.buffer.seek(0)
+        self.buffer.truncate(0)
+        return line
+
+    def __call__(self, record: Dict[str, Any]) -> str:
+        if not self.header_written:
+            self.header_written = True
+            return self._row(record.keys()) + self._row(record.values())
+        return self._row(record.values())
+
+
+def _stream_csv(records: Iterator[Any], delimiter: str = ",") -> Iterator[bytes]:
+    """
+    Yield UTF-8 CSV in ~64 KB chunks, writing the header from the first record (dict or neo4j Record).
+    Mid-stream failures are logged and re-raised, as in _astream_csv.
+    """
+    render = _CSVRows(delimiter)
+    lines: List[str] = []
+    size = 0
+    try:
+        for record in records:
+            line = render(record)
+            lines.append(line)
+            size += len(line)
+            if size >= _CSV_CHUNK_CHARS:
+                yield "".join(lines).encode("utf-8")
+                lines.clear()
+                size = 0
+    except Exception as e:
+        logger.error(f"CSV export interrupted: {e}")
+        raise
+    if lines:
+        yield "".join(lines).encode("utf-8")
+
+
+async def _astream_csv(records: AsyncIterator[Dict[str, Any]], delimiter: str = ",") -> AsyncIterator[bytes]:
+    """
+    Async variant of _stream_csv; runs on the event loop instead of the threadpool.
+    A failure mid-stream is logged and re-raised, which aborts the chunked body
+    without its terminating chunk, so clients see a truncated transfer.
+    """
+    render = _CSVRows(delimiter)
+    lines: List[str] = []
+    size = 0
+    try:
+        async for record in records:
+            line = render(record)
+            lines.append(line)
+            size += len(line)
+            if size >= _CSV_CHUNK_CHARS:
+                yield "".join(lines).encode("utf-8")
+                lines.clear()
+                size = 0
+    except Exception as e:
+        logger.error(f"CSV export interrupted: {e}")
+        raise
+    if lines:
+        yield "".join(lines).encode("utf-8")
+
+
+async def _astream_json_envelope(
+    key: str,
+    records: AsyncIterator[Dict[str, Any]],
+    trailer: Callable[[int, Optional[Dict[str, Any]]], Dict[str, Any]]
+) -> AsyncIterator[bytes]:
+    """
+    Stream `{"<key>": [...], **trailer}` with the array written record by record.
+    `trailer(count, last_record)` supplies the remaining fields once the array is done.
+    
+    If fetching fails part-way the envelope is still closed, with an `error`
+    field added, so a cut-off export is distinguishable from a complete one.
+    """
+    yield b'{"' + key.encode() + b'":['
+    count = 0
+    last = None
+    error = None
+    try:
+        async for record in records:
+            yield (b"," if count else b"") + json_dumps(record)
+            count += 1
+            last = record
+    except Exception as e:
+        logger.error(f"Streaming {key} export interrupted after {count} records: {e}")
+        error = f"Export interrupted: {e}"
+    fields = trailer(count, last)
+    if error is not None:
+        fields["error"] = error
+    # Splice the trailer object's fields in after the array
+    yield b"]," + json_dumps(fields)[1:]
+
+
+def _cypher_joined(list_expr: str) -> str:
+    """Cypher expression joining a list property with '; ' (no APOC dependency)."""
+    return (
+        f"reduce(s = '', x IN coalesce({list_expr}, []) | "
+        "s + CASE WHEN s = '' THEN '' ELSE '; ' END + x)"
+    )
+
+
+# One keyset page of entities; the entity_id uniqueness constraint backs the ORDER BY.
+# CSV/TSV get synonyms already joined by Neo4j, JSON keeps the list.
+_ENTITY_PAGE_TEMPLATE = """
+MATCH (e:Entity)
+WHERE ($entity_type IS NULL OR e.entity_type = $entity_type)
+  AND ($cursor IS NULL OR e.entity_id > $cursor)
+RETURN e.entity_id as entity_id, e.name as name, e.entity_type as type,
+       e.canonical_id as canonical_id, e.confidence as confidence,
+       {synonyms} as synonyms
+ORDER BY e.entity_id
+LIMIT $page_size
+"""
+_ENTITY_PAGE_QUERY = _ENTITY_PAGE_TEMPLATE.format(synonyms="e.synonyms")
+_ENTITY_PAGE_CSV_QUERY = _ENTITY_PAGE_TEMPLATE.format(synonyms=_cypher_joined("e.synonyms"))
+
+
+# Peak bytes a single export page should occupy; page sizes are derived from it
+_EXPORT_TARGET_BYTES = 32 * 1024 * 1024
+_MIN_PAGE_SIZE = 256
+_SAMPLE_ROWS = 8
+
+
+def _choose_page_size(sample_rows: List[Dict[str, Any]], max_page_size: int, target_bytes: int = _EXPORT_TARGET_BYTES) -> int:
+    """Size pages from the serialized width of a few sample rows so wide rows get smaller pages."""
+    per_row = max(1, len(json_dumps(sample_rows)) // len(sample_rows))
+    return min(max_page_size, max(_MIN_PAGE_SIZE, target_bytes // per_row))
+
+
+async def _keyset_batches(
+    query: str,
+    params: Dict[str, Any],
+    key: str,
+    page_size: int,
+    cursor: Optional[Any] = None,
+    limit: Optional[int] = None
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield a keyset-paginated query one page (list of rows) at a time, so neither
+    Neo4j nor this process ever holds more than one page. The query must filter
+    on `$cursor`, order by `key` and end with `LIMIT $page_size`.
+    
+    A small first page is used to measure row width; later pages are sized to
+    stay under _EXPORT_TARGET_BYTES, with `page_size` as the upper bound.
+    """
+    remaining = limit
+    size = min(page_size, _SAMPLE_ROWS)
+    sized = False
+    while remaining is None or remaining > 0:
+        if remaining is not None:
+            size = min(size, remaining)
+        rows = await neo4j_client.arun_query(query, {**params, "cursor": cursor, "page_size": size})
+        if rows:
+            yield rows
+        if len(rows) < size:
+            return
+        cursor = rows[-1][key]
+        if remaining is not None:
+            remaining -= len(rows)
+        if not sized:
+            size = _choose_page_size(rows, page_size)
+            sized = True
+            logger.debug(f"Export page size for {key} keyset: {size} rows")
+
+
+async def _chain_pages(
+    first: Optional[List[Dict[str, Any]]],
+    batches: AsyncIterator[List[Dict[str, Any]]]
+) -> AsyncIterator[Dict[str, Any]]:
+    if first is None:
+        return
+    for row in first:
+        yield row
+    async for rows in batches:
+        for row in rows:
+            yield row
+
+
+async def _open_keyset_pages(
+    query: str,
+    params: Dict[str, Any],
+    key: str,
+    page_size: int,
+    cursor: Optional[Any] = None,
+    limit: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Row-by-row view of _keyset_batches. The first page is fetched before this
+    returns, so connection and query errors surface while the handler can
+    still answer with an error status instead of an empty 200 stream.
+    """
+    batches = _keyset_batches(query, params, key, page_size, cursor, limit)
+    first = await anext(batches, None)
+    return _chain_pages(first, batches)
+
+
+# Full-graph JSON export: the node and relationship queries run back to back on
+# one session, each pulled from its open result in fetch-size batches. Two
+# queries rather than one UNION, whose row order Cypher does not guarantee.
+_GRAPH_NODES_QUERY = """
+MATCH (n)
+RETURN id(n) as id, labels(n) as labels, properties(n) as properties
+"""
+_GRAPH_RELATIONSHIPS_QUERY = """
+MATCH (a)-[r]->(b)
+RETURN id(r) as id, properties(r) as properties, id(a) as source, id(b) as target, type(r) as type
+"""
+_GRAPH_FETCH_SIZE = 5000
+
+
+def _write_graph_json(fh: io.BufferedIOBase) -> None:
+    """Write the knowledge-graph JSON export: nodes, then relationships, then statistics."""
+    node_count = 0
+    relationship_count = 0
+    
+    with neo4j_client.read_session(fetch_size=_GRAPH_FETCH_SIZE) as session:
+        fh.write(b'{"graph":{"nodes":[')
+        for id_, labels, properties in session.run(_GRAPH_NODES_QUERY):
+            if node_count:
+                fh.write(b",")
+            fh.write(json_dumps({"labels": labels, "properties": properties, "id": id_}))
+            node_count += 1
+        
+        fh.write(b'],"relationships":[')
+        for id_, properties, source, target, rel_type in session.run(_GRAPH_RELATIONSHIPS_QUERY):
+            if relationship_count:
+                fh.write(b",")
+            fh.write(json_dumps({
+                "source": source, "target": target, "type": rel_type,
+                "properties": properties, "id": id_
+            }))
+            relationship_count += 1
+    
+    # Splice the remaining top-level fields in after the graph object
+    fh.write(b"]}," + json_dumps({
+        "statistics": {
+            "node_count": node_count,
+            "relationship_count": relationship_count
+        },
+        "export_date": utc_timestamp(),
+        "format": "json"
+    })[1:])
+
+
+# The formats catalogue is fully static, so serialize it once at import
+_FORMATS_BYTES = orjson.dumps({
+    "formats": [
+        {
+            "id": "knowledge-graph",
+            "name": "Neo4j Knowledge Graph",
+            "description": "Complete research relationship graph with entities and connections",
+            "format": "GraphML / Cypher",
+            "estimated_size": "2.3 GB",
+            "status": "available",
+            "data_types": ["Entities", "Relationships", "Publications", "Metadata"]
+        },
+        {
+            "id": "vector-embeddings",
+            "name": "ColPali Vector Embeddings", 
+            "description": "High-dimensional semantic embeddings for similarity search",
+            "format": "NPY / HDF5",
+            "estimated_size": "1.8 GB",
+            "status": "available",
+            "data_types": ["Document Embeddings", "Image Embeddings", "Metadata"]
+        },
+        {
+            "id": "research-summaries",
+            "name": "Research Summaries",
+            "description": "AI-generated summaries and key findings from all publications",
+            "format": "JSON / CSV",
+            "estimated_size": "45 MB",
+            "status": "available",
+            "data_types": ["Summaries", "Key Findings", "Citations", "Topics"]
+        },
+        {
+            "id": "biomedical-entities",
+            "name": "Biomedical Entities",
+            "description": "Extracted organisms, genes, proteins, and experimental conditions",
+            "format": "JSON / TSV",
+            "estimated_size": "128 MB", 
+            "status": "available",
+            "data_types": ["Species", "Genes", "Proteins", "Conditions", "Endpoints"]
+        },
+
+        {
+            "id": "api-documentation",
+            "name": "API Access Documentation",
+            "description": "Complete API documentation and programmatic access guides",
+            "format": "OpenAPI / Markdown",
+            "estimated_size": "5 MB",
+            "status": "available",
+            "data_types": ["Endpoints", "Schemas", "Examples", "Authentication"]
+        }
+    ],
+    "total_size": "4.3 GB",
+    "pipeline_integration": [
+        {
+            "component": "Ingestion Pipeline",
+            "status": "active",
+            "exports": ["Raw Text", "Metadata", "Processing Logs"]
+        },
+        {
+            "component": "OCR Engine", 
+            "status": "active",
+            "exports": ["OCR Text", "Confidence Scores", "Image Regions"]
+        },
+        {
+            "component": "Vector Database",
+            "status": "active", 
+            "exports": ["Vector Index", "Similarity Matrices", "Search Results"]
+        },
+        {
+            "component": "Knowledge Graph",
+            "status": "active",
+            "exports": ["Graph Data", "Query Results", "Analytics"]
+        }
+    ]
+})
 
 
 @router.get("/formats")
 async def get_export_formats():
     """Get available export formats and their details."""
-    return {
-        "formats": [
-            {
-                "id": "knowledge-graph",
-                "name": "Neo4j Knowledge Graph",
-                "description": "Complete research relationship graph with entities and connections",
-                "format": "GraphML / Cypher",
-                "estimated_size": "2.3 GB",
-                "status": "available",
-                "data_types": ["Entities", "Relationships", "Publications", "Metadata"]
-            },
-            {
-                "id": "vector-embeddings",
-                "name": "ColPali Vector Embeddings", 
-                "description": "High-dimensional semantic embeddings for similarity search",
-                "format": "NPY / HDF5",
-                "estimated_size": "1.8 GB",
-                "status": "available",
-                "data_types": ["Document Embeddings", "Image Embeddings", "Metadata"]
-            },
-            {
-                "id": "research-summaries",
-                "name": "Research Summaries",
-                "description": "AI-generated summaries and key findings from all publications",
-                "format": "JSON / CSV",
-                "estimated_size": "45 MB",
-                "status": "available",
-                "data_types": ["Summaries", "Key Findings", "Citations", "Topics"]
-            },
-            {
-                "id": "biomedical-entities",
-                "name": "Biomedical Entities",
-                "description": "Extracted organisms, genes, proteins, and experimental conditions",
-                "format": "JSON / TSV",
-                "estimated_size": "128 MB", 
-                "status": "available",
-                "data_types": ["Species", "Genes", "Proteins", "Conditions", "Endpoints"]
-            },
-
-            {
-                "id": "api-documentation",
-                "name": "API Access Documentation",
-                "description": "Complete API documentation and programmatic access guides",
-                "format": "OpenAPI / Markdown",
-                "estimated_size": "5 MB",
-                "status": "available",
-                "data_types": ["Endpoints", "Schemas", "Examples", "Authentication"]
-            }
-        ],
-        "total_size": "4.3 GB",
-        "pipeline_integration": [
-            {
-                "component": "Ingestion Pipeline",
-                "status": "active",
-                "exports": ["Raw Text", "Metadata", "Processing Logs"]
-            },
-            {
-                "component": "OCR Engine", 
-                "status": "active",
-                "exports": ["OCR Text", "Confidence Scores", "Image Regions"]
-            },
-            {
-                "component": "Vector Database",
-                "status": "active", 
-                "exports": ["Vector Index", "Similarity Matrices", "Search Results"]
-            },
-            {
-                "component": "Knowledge Graph",
-                "status": "active",
-                "exports": ["Graph Data", "Query Results", "Analytics"]
-            }
-        ]
-    }
+    return Response(_FORMATS_BYTES, media_type="application/json")
 
 
 @router.get("/entities")
 async def export_entities(
     format: str = Query("json", enum=["json", "csv", "tsv"]),
     limit: Optional[int] = Query(None, ge=1),
-    entity_type: Optional[str] = None
+    entity_type: Optional[str] = None,
+    page_size: int = Query(10000, ge=1, le=50000),
+    cursor: Optional[str] = None
 ):
-    """Export biomedical entities in specified format."""
+    """
+    Export biomedical entities in specified format.
+    
+    Rows are ordered by entity_id, fetched from Neo4j in keyset pages of
+    `page_size` and streamed as they arrive. Pass `limit` to cap a response and
+    the returned JSON `next_cursor` (the last entity_id) as `cursor` to resume.
+    """
+    params = {"entity_type": entity_type}
+    query = _ENTITY_PAGE_CSV_QUERY if format in ["csv", "tsv"] else _ENTITY_PAGE_QUERY
+    
     try:
-        # Build query with optional filters
-        query = """
-        MATCH (e:Entity)
-        WHERE ($entity_type IS NULL OR e.entity_type = $entity_type)
-        RETURN e.entity_id as entity_id, e.name as name, e.entity_type as type,
-               e.canonical_id as canonical_id, e.confidence as confidence,
-               e.synonyms as synonyms
-        ORDER BY e.entity_type, e.name
-        """
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        entities = neo4j_client.run_query(query, entity_type=entity_type)
-        
-        if format == "json":
-            return {
-                "entities": entities,
-                "count": len(entities),
-                "export_date": datetime.now().isoformat(),
-                "filters": {
-                    "entity_type": entity_type,
-                    "limit": limit
-                }
-            }
-        
-        elif format in ["csv", "tsv"]:
-            delimiter = "," if format == "csv" else "\t"
-            output = io.StringIO()
-            
-            if entities:
-                # Flatten synonyms for CSV/TSV
-                for entity in entities:
-                    if entity.get('synonyms'):
-                        entity['synonyms'] = '; '.join(entity['synonyms'])
-                    else:
-                        entity['synonyms'] = ''
-                
-                writer = csv.DictWriter(output, fieldnames=entities[0].keys(), delimiter=delimiter)
-                writer.writeheader()
-                writer.writerows(entities)
-            
-            content = output.getvalue()
-            
-            return StreamingResponse(
-                io.BytesIO(content.encode()),
-                media_type=f"text/{format}",
-                headers={"Content-Disposition": f"attachment; filename=bionexus_entities.{format}"}
-            )
-        
+        rows = await _open_keyset_pages(query, params, "entity_id", page_size, cursor, limit)
     except Exception as e:
         logger.error(f"Entity export failed: {e}")
         raise HTTPException(status_code=500, detail=f"Export failed: {e}")
+    
+    if format in ["csv", "tsv"]:
+        delimiter = "," if format == "csv" else "\t"
+        return StreamingResponse(
+            _astream_csv(rows, delimiter=delimiter),
+            media_type=f"text/{format}",
+            headers={"Content-Disposition": f"attachment; filename=bionexus_entities.{format}"}
+        )
+    
+    export_date = utc_timestamp()
+    
+    def trailer(count: int, last: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {
+            "count": count,
+            "next_cursor": last["entity_id"] if last and limit and count == limit else None,
+            "export_date": export_date,
+            "filters": {
+                "entity_type": entity_type,
+                "limit": limit
+            }
+        }
+    
+    return StreamingResponse(
+        _astream_json_envelope("entities", rows, trailer),
+        media_type="application/json"
+    )
+
+
+# Publications export. Optional filters use the `$x IS NULL OR ...` form and the
+# limit is a parameter, so every request shares one cached plan per format.
+# CSV needs a flat column, so Neo4j joins the author list before it reaches the driver.
+_NO_LIMIT = 2 ** 31
+
+_PUBLICATIONS_TEMPLATE = """
+MATCH (p:Publication)
+WHERE ($year_from IS NULL OR p.year >= $year_from)
+  AND ($year_to IS NULL OR p.year <= $year_to)
+RETURN p.pub_id as pub_id, p.title as title, {authors} as authors,
+       p.year as year, p.journal as journal, p.doi as doi,
+       p.total_pages as total_pages, p.abstract as abstract
+ORDER BY p.year DESC, p.title
+LIMIT $limit
+"""
+_PUBLICATIONS_QUERY = _PUBLICATIONS_TEMPLATE.format(authors="p.authors")
+_PUBLICATIONS_CSV_QUERY = _PUBLICATIONS_TEMPLATE.format(authors=_cypher_joined("p.authors"))
 
 
 @router.get("/publications")
 async def export_publications(
+    request: Request,
     format: str = Query("json", enum=["json", "csv"]),
     limit: Optional[int] = Query(None, ge=1),
     year_from: Optional[int] = None,
@@ -181,144 +545,143 @@ async def export_publications(
 ):
     """Export publications with optional filtering."""
     try:
-        # Build query with optional filters
-        where_clauses = []
-        params = {}
-        
-        if year_from:
-            where_clauses.append("p.year >= $year_from")
-            params["year_from"] = year_from
-            
-        if year_to:
-            where_clauses.append("p.year <= $year_to") 
-            params["year_to"] = year_to
-        
-        where_clause = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+        # Filters and limit are bound as parameters so Neo4j reuses one cached plan
+        params = {
+            "year_from": year_from,
+            "year_to": year_to,
+            "limit": limit or _NO_LIMIT
+        }
+        query = _PUBLICATIONS_CSV_QUERY if format == "csv" else _PUBLICATIONS_QUERY
         
-        query = f"""
-        MATCH (p:Publication)
-        {where_clause}
-        RETURN p.pub_id as pub_id, p.title as title, p.authors as authors,
-               p.year as year, p.journal as journal, p.doi as doi,
-               p.total_pages as total_pages, p.abstract as abstract
-        ORDER BY p.year DESC, p.title
-        """
-        
-        if limit:
-            query += f" LIMIT {limit}"
-        
-        publications = neo4j_client.run_query(query, **params)
+        if format == "csv":
+            records = neo4j_client.stream_records(query, params)
+            # Run the query and pull the first record here, so failures are handled
+            # below instead of after the handler has returned the stream
+            first = await asyncio.to_thread(next, records, None)
+            rows = records if first is None else itertools.chain((first,), records)
+            return StreamingResponse(
+                _stream_csv(rows),
+                media_type="text/csv",
+                headers={"Content-Disposition": "attachment; filename=bionexus_publications.csv"}
+            )
         
-        if format == "json":
-            return {
+        def build() -> Response:
+            publications = neo4j_client.run_query(query, params)
+            
+            return json_response({
                 "publications": publications,
                 "count": len(publications),
-                "export_date": datetime.now().isoformat(),
+                "export_date": utc_timestamp(),
                 "filters": {
                     "year_range": [year_from, year_to] if year_from or year_to else None,
                     "limit": limit
                 }
-            }
+            })
         
-        elif format == "csv":
-            output = io.StringIO()
-            
-            if publications:
-                # Flatten authors array for CSV
-                for pub in publications:
-                    if pub.get('authors'):
-                        pub['authors'] = '; '.join(pub['authors'])
-                    else:
-                        pub['authors'] = ''
-                
-                writer = csv.DictWriter(output, fieldnames=publications[0].keys())
-                writer.writeheader()
-                writer.writerows(publications)
-            
-            content = output.getvalue()
-            
-            return StreamingResponse(
-                io.BytesIO(content.encode()),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=bionexus_publications.csv"}
-            )
+        return await _cached_export(
+            request, "publications", {"limit": limit, "year_from": year_from, "year_to": year_to}, build
+        )
         
     except Exception as e:
         logger.error(f"Publication export failed: {e}")
         raise HTTPException(status_code=500, detail=f"Export failed: {e}")
 
 
-@router.get("/knowledge-graph")
-async def export_knowledge_graph(
-    format: str = Query("graphml", enum=["graphml", "cypher", "json"]),
-    include_embeddings: bool = False
-):
-    """Export the complete knowledge graph."""
+# The full-graph JSON export is written once to disk and served from there with
+# FileResponse (sendfile where available) until export_cache_ttl expires. Workers
+# share the directory. Each build is published atomically under its own
+# kg-<uuid>.json name and never rewritten, so a path handed to FileResponse keeps
+# matching its stat. Old builds are retired by a background task once no request
+# can still be about to open them; /cache/clear only touches a marker file.
+_GRAPH_EXPORT_DIR = os.path.join(tempfile.gettempdir(), "bionexus_graph_exports")
+_GRAPH_EXPORT_CLEARED = os.path.join(_GRAPH_EXPORT_DIR, "cleared")
+# Extra lifetime past export_cache_ttl before an artifact is unlinked, covering
+# the gap between choosing a file and FileResponse opening it
+_GRAPH_EXPORT_GRACE_S = 60
+_graph_export_lock = asyncio.Lock()
+
+
+def _graph_exports() -> List[Tuple[str, os.stat_result]]:
+    """Published graph export artifacts with their stat results, newest first."""
+    artifacts = []
     try:
-        if format == "json":
-            # Export as JSON for easier processing
-            nodes_query = """
-            MATCH (n)
-            RETURN labels(n) as labels, properties(n) as properties, id(n) as id
-            """
-            
-            relationships_query = """
-            MATCH (a)-[r]->(b)
-            RETURN id(a) as source, id(b) as target, type(r) as type, 
-                   properties(r) as properties, id(r) as id
-            """
-            
-            nodes = neo4j_client.run_query(nodes_query)
-            relationships = neo4j_client.run_query(relationships_query)
-            
-            return {
-                "graph": {
-                    "nodes": nodes,
-                    "relationships": relationships
-                },
-                "statistics": {
-                    "node_count": len(nodes),
-                    "relationship_count": len(relationships)
-                },
-                "export_date": datetime.now().isoformat(),
-                "format": "json"
-            }
-        
-        elif format == "cypher":
-            # Generate Cypher statements for recreating the graph
-            cypher_statements = [
-                "// BioNexus Knowledge Graph Export",
-                f"// Generated: {datetime.now().isoformat()}",
-                "// Clear existing data (uncomment if needed)",
-                "// MATCH (n) DETACH DELETE n;",
-                "",
-                "// Create nodes",
-            ]
-            
-            # This would generate actual Cypher CREATE statements
-            # For now, return a sample
-            sample_cypher = """
+        with os.scandir(_GRAPH_EXPORT_DIR) as entries:
+            for entry in entries:
+                if entry.name.startswith("kg-") and entry.name.endswith(".json"):
+                    try:
+                        artifacts.append((entry.path, entry.stat()))
+                    except FileNotFoundError:
+                        pass
+    except FileNotFoundError:
+        return []
+    artifacts.sort(key=lambda artifact: artifact[1].st_mtime, reverse=True)
+    return artifacts
+
+
+def _fresh_graph_export() -> Optional[Tuple[str, os.stat_result]]:
+    cutoff = time.time() - settings.export_cache_ttl
+    try:
+        cutoff = max(cutoff, os.stat(_GRAPH_EXPORT_CLEARED).st_mtime)
+    except FileNotFoundError:
+        pass
+    artifacts = _graph_exports()
+    if artifacts and artifacts[0][1].st_mtime > cutoff:
+        return artifacts[0]
+    return None
+
+
+def _retire_graph_exports() -> None:
+    """Unlink graph export artifacts too old to be handed to any response."""
+    cutoff = time.time() - settings.export_cache_ttl - _GRAPH_EXPORT_GRACE_S
+    for path, stat_result in _graph_exports():
+        if stat_result.st_mtime < cutoff:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+
+
+async def _graph_export_file() -> Tuple[str, os.stat_result]:
+    """Return the path and stat of an up-to-date knowledge-graph JSON export, building it if needed."""
+    async with _graph_export_lock:
+        artifact = _fresh_graph_export()
+        if artifact is None:
+            os.makedirs(_GRAPH_EXPORT_DIR, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=_GRAPH_EXPORT_DIR, prefix="kg-", suffix=".tmp")
+            path = os.path.join(_GRAPH_EXPORT_DIR, f"kg-{uuid.uuid4().hex}.json")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    await asyncio.to_thread(_write_graph_json, fh)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            artifact = path, os.stat(path)
+    return artifact
+
+
+# Cypher and GraphML exports are constant apart from the generation time,
+# so both are kept as bytes templates with a single %s placeholder
+_CYPHER_TEMPLATE = "\n".join([
+    "// BioNexus Knowledge Graph Export",
+    "// Generated: %s",
+    "// Clear existing data (uncomment if needed)",
+    "// MATCH (n) DETACH DELETE n;",
+    "",
+    "// Create nodes",
+    # This would generate actual Cypher CREATE statements
+    # For now, return a sample
+    """
             CREATE (p:Publication {pub_id: 'sample_001', title: 'Sample Research Paper'})
             CREATE (e:Entity {entity_id: 'ent_001', name: 'Sample Entity', entity_type: 'Organism'})
             CREATE (p)-[:MENTIONS]->(e)
-            """
-            
-            cypher_statements.append(sample_cypher)
-            
-            content = "\n".join(cypher_statements)
-            
-            return StreamingResponse(
-                io.BytesIO(content.encode()),
-                media_type="text/plain",
-                headers={"Content-Disposition": "attachment; filename=bionexus_graph.cypher"}
-            )
-        
-        else:  # GraphML format
-            # Generate GraphML XML format
-            graphml_content = f"""<?xml version="1.0" encoding="UTF-8"?>
+            """,
+]).encode()
+
+_GRAPHML_TEMPLATE = b"""<?xml version="1.0" encoding="UTF-8"?>
 <graphml xmlns="http://graphml.graphdrawing.org/xmlns">
   <!-- BioNexus Knowledge Graph Export -->
-  <!-- Generated: {datetime.now().isoformat()} -->
+  <!-- Generated: %s -->
   
   <key id="type" for="node" attr.name="type" attr.type="string"/>
   <key id="name" for="node" attr.name="name" attr.type="string"/>
@@ -339,9 +702,37 @@ async def export_knowledge_graph(
     </edge>
   </graph>
 </graphml>"""
-            
-            return StreamingResponse(
-                io.BytesIO(graphml_content.encode()),
+
+
+@router.get("/knowledge-graph")
+async def export_knowledge_graph(
+    format: str = Query("graphml", enum=["graphml", "cypher", "json"]),
+    include_embeddings: bool = False
+):
+    """Export the complete knowledge graph."""
+    try:
+        if format == "json":
+            # Export as JSON for easier processing, served from the on-disk artifact
+            path, stat_result = await _graph_export_file()
+            return FileResponse(
+                path,
+                stat_result=stat_result,
+                media_type="application/json",
+                filename="bionexus_graph.json",
+                background=BackgroundTask(_retire_graph_exports)
+            )
+        
+        elif format == "cypher":
+            # Generate Cypher statements for recreating the graph
+            return Response(
+                _CYPHER_TEMPLATE % utc_timestamp().encode(),
+                media_type="text/plain",
+                headers={"Content-Disposition": "attachment; filename=bionexus_graph.cypher"}
+            )
+        
+        else:  # GraphML format
+            return Response(
+                _GRAPHML_TEMPLATE % utc_timestamp().encode(),
                 media_type="application/xml",
                 headers={"Content-Disposition": "attachment; filename=bionexus_graph.graphml"}
             )
@@ -351,108 +742,165 @@ async def export_knowledge_graph(
         raise HTTPException(status_code=500, detail=f"Export failed: {e}")
 
 
+# Placeholder AI insights attached to every research summary. Every row shares
+# these same objects (and the pre-joined CSV strings) instead of fresh copies.
+_SUMMARY_KEY_FINDINGS = (
+    "Research demonstrates significant biological adaptation",
+    "Novel mechanisms identified for environmental stress response",
+    "Implications for space mission planning established"
+)
+_SUMMARY_TOPICS = ("Space Biology", "Adaptation", "Research")
+_SUMMARY_KEY_FINDINGS_CSV = "; ".join(_SUMMARY_KEY_FINDINGS)
+_SUMMARY_TOPICS_CSV = "; ".join(_SUMMARY_TOPICS)
+_SUMMARY_RELEVANCE_SCORE = 0.85
+
+
+def _summary_rows(records: Iterator[Dict[str, Any]], flatten: bool = False) -> Iterator[Dict[str, Any]]:
+    """Enhance (and for CSV, flatten) each summary in a single pass as it streams from Neo4j."""
+    if flatten:
+        key_findings, topics = _SUMMARY_KEY_FINDINGS_CSV, _SUMMARY_TOPICS_CSV
+    else:
+        key_findings, topics = _SUMMARY_KEY_FINDINGS, _SUMMARY_TOPICS
+    
+    for summary in records:
+        if flatten:
+            summary["authors"] = '; '.join(summary.get("authors") or [])
+        summary["key_findings"] = key_findings
+        summary["topics"] = topics
+        summary["relevance_score"] = _SUMMARY_RELEVANCE_SCORE
+        yield summary
+
+
 @router.get("/research-summaries")
-async def export_research_summaries(format: str = Query("json", enum=["json", "csv"])):
+async def export_research_summaries(request: Request, format: str = Query("json", enum=["json", "csv"])):
     """Export AI-generated research summaries."""
     try:
-        # Query for publications with abstracts/summaries
-        query = """
-        MATCH (p:Publication)
-        WHERE p.abstract IS NOT NULL
-        RETURN p.pub_id as pub_id, p.title as title, p.authors as authors,
-               p.year as year, p.abstract as summary, p.journal as journal
-        ORDER BY p.year DESC
-        """
-        
-        summaries = neo4j_client.run_query(query)
-        
-        # Enhance with mock AI-generated insights
-        for summary in summaries:
-            summary["key_findings"] = [
-                "Research demonstrates significant biological adaptation",
-                "Novel mechanisms identified for environmental stress response",
-                "Implications for space mission planning established"
-            ]
-            summary["topics"] = ["Space Biology", "Adaptation", "Research"]
-            summary["relevance_score"] = 0.85
-        
-        if format == "json":
-            return {
-                "summaries": summaries,
-                "count": len(summaries),
-                "export_date": datetime.now().isoformat(),
-                "processing_info": {
-                    "ai_enhanced": True,
-                    "summary_method": "Abstract extraction + AI analysis"
-                }
-            }
-        
-        elif format == "csv":
-            output = io.StringIO()
+        def build() -> Response:
+            # Query for publications with abstracts/summaries
+            query = """
+            MATCH (p:Publication)
+            WHERE p.abstract IS NOT NULL
+            RETURN p.pub_id as pub_id, p.title as title, p.authors as authors,
+                   p.year as year, p.abstract as summary, p.journal as journal
+            ORDER BY p.year DESC
+            """
             
-            if summaries:
-                # Flatten complex fields for CSV
-                for item in summaries:
-                    item['authors'] = '; '.join(item.get('authors', []))
-                    item['key_findings'] = '; '.join(item.get('key_findings', []))
-                    item['topics'] = '; '.join(item.get('topics', []))
-                
-                writer = csv.DictWriter(output, fieldnames=summaries[0].keys())
-                writer.writeheader()
-                writer.writerows(summaries)
+            records = neo4j_client.stream_query(query)
             
-            content = output.getvalue()
+            if format == "json":
+                summaries = list(_summary_rows(records))
+                return json_response({
+                    "summaries": summaries,
+                    "count": len(summaries),
+                    "export_date": utc_timestamp(),
+                    "processing_info": {
+                        "ai_enhanced": True,
+                        "summary_method": "Abstract extraction + AI analysis"
+                    }
+                })
             
-            return StreamingResponse(
-                io.BytesIO(content.encode()),
-                media_type="text/csv",
-                headers={"Content-Disposition": "attachment; filename=bionexus_summaries.csv"}
-            )
+            elif format == "csv":
+                output = io.BytesIO()
+                text = io.TextIOWrapper(output, encoding="utf-8", newline="", write_through=True)
+                writer = csv.writer(text)
+                
+                # Rows are enhanced, flattened and written one at a time
+                rows = _summary_rows(records, flatten=True)
+                first = next(rows, None)
+                if first is not None:
+                    writer.writerow(first.keys())
+                    writer.writerow(first.values())
+                    writer.writerows(item.values() for item in rows)
+                
+                # Detach so collecting the wrapper doesn't close the byte buffer
+                text.detach()
+                
+                return Response(
+                    output.getvalue(),
+                    media_type="text/csv",
+                    headers={"Content-Disposition": "attachment; filename=bionexus_summaries.csv"}
+                )
+        
+        return await _cached_export(request, "research-summaries", {"format": format}, build)
         
     except Exception as e:
         logger.error(f"Research summaries export failed: {e}")
         raise HTTPException(status_code=500, detail=f"Export failed: {e}")
 
 
+# Static part of /pipeline-status, pre-serialized without its closing brace so
+# the handler only appends the volatile last_updated field
+_PIPELINE_PREFIX = orjson.dumps({
+    "pipeline_components": [
+        {
+            "name": "Ingestion Pipeline",
+            "status": "active",
+            "description": "Processing NASA bioscience publications",
+            "data_processed": "608 documents",
+            "last_update": "2 minutes ago"
+        },
+        {
+            "name": "OCR Engine",
+            "status": "active", 
+            "description": "Text extraction from document images",
+            "data_processed": "2,431 pages",
+            "last_update": "5 minutes ago"
+        },
+        {
+            "name": "Vector Database",
+            "status": "active",
+            "description": "Semantic similarity indexing",
+            "data_processed": "1.8M embeddings",
+            "last_update": "1 hour ago"
+        },
+        {
+            "name": "Knowledge Graph",
+            "status": "connected",
+            "description": "Neo4j relationship storage",
+            "data_processed": "24.7K entities",
+            "last_update": "30 minutes ago"
+        }
+    ],
+    "export_statistics": {
+        "total_data_size": "4.3 GB",
+        "available_formats": 6,
+        "active_exports": 0,
+        "completed_exports": 0
+    }
+})[:-1]
+
+
 @router.get("/pipeline-status")
 async def get_pipeline_status():
     """Get the current status of the export pipeline."""
-    return {
-        "pipeline_components": [
-            {
-                "name": "Ingestion Pipeline",
-                "status": "active",
-                "description": "Processing NASA bioscience publications",
-                "data_processed": "608 documents",
-                "last_update": "2 minutes ago"
-            },
-            {
-                "name": "OCR Engine",
-                "status": "active", 
-                "description": "Text extraction from document images",
-                "data_processed": "2,431 pages",
-                "last_update": "5 minutes ago"
-            },
-            {
-                "name": "Vector Database",
-                "status": "active",
-                "description": "Semantic similarity indexing",
-                "data_processed": "1.8M embeddings",
-                "last_update": "1 hour ago"
-            },
-            {
-                "name": "Knowledge Graph",
-                "status": "connected",
-                "description": "Neo4j relationship storage",
-                "data_processed": "24.7K entities",
-                "last_update": "30 minutes ago"
-            }
-        ],
-        "export_statistics": {
-            "total_data_size": "4.3 GB",
-            "available_formats": 6,
-            "active_exports": 0,
-            "completed_exports": 0
-        },
-        "last_updated": datetime.now().isoformat()
-    }
\ No newline at end of file
+    return Response(
+        _PIPELINE_PREFIX + b',"last_updated":"' + utc_timestamp().encode() + b'"}',
+        media_type="application/json"
+    )
+
+
+async def _require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """Admin routes are hidden unless ADMIN_TOKEN is set, then need a matching X-Admin-Token."""
+    if not settings.admin_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), settings.admin_token.encode()
+    ):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@router.post("/cache/clear", dependencies=[Depends(_require_admin)], include_in_schema=False)
+async def clear_export_cache():
+    """Drop all cached export bodies and graph responses (call after new data has been loaded)."""
+    cleared = len(_export_cache)
+    _export_cache.clear()
+    if await asyncio.to_thread(_fresh_graph_export) is not None:
+        cleared += 1
+    # Artifacts older than the marker are treated as stale by every worker
+    os.makedirs(_GRAPH_EXPORT_DIR, exist_ok=True)
+    with open(_GRAPH_EXPORT_CLEARED, "wb"):
+        pass
+    os.utime(_GRAPH_EXPORT_CLEARED)
+    cleared += clear_local_cache()
+    cleared += await response_cache.invalidate("graph:")
+    return {"cleared": cleared}
@@ -1,13 +1,299 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Tuple
+import asyncio
 import logging
+import orjson
+import re
+import time
+from collections import OrderedDict
 
-from ..schemas import KGQuery, KGQueryResponse, Publication
+from ..schemas import Publication
+from ..services.cache import cache_key, response_cache
 from ..services.neo4j_client import neo4j_client
+from ..utils import json_dumps, json_response, utc_timestamp
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+def _cypher_property_values(var: str) -> str:
+    """
+    Cypher list of an element's property values, in keys() order, each already
+    rendered as a display string (lists joined with ", "), so rows need no
+    per-property type dispatch in Python. Plain Cypher, no APOC.
+    """
+    value = f"{var}[k]"
+    return (
+        f"[k IN keys({var}) | CASE\n"
+        f"                WHEN valueType({value}) STARTS WITH 'LIST' THEN reduce(s = '', x IN\n"
+        f"                    [i IN {value} WHERE i IS NOT NULL | toString(i)] |\n"
+        f"                    s + CASE WHEN s = '' THEN '' ELSE ', ' END + x)\n"
+        f"                WHEN {value} = true THEN 'True'\n"
+        f"                WHEN {value} = false THEN 'False'\n"
+        f"                ELSE coalesce(toString({value}), 'N/A')\n"
+        f"            END]"
+    )
+
+
+def _cypher_string_properties(var: str) -> str:
+    """RETURN columns property_keys/property_values for _string_properties."""
+    return f"keys({var}) as property_keys,\n            {_cypher_property_values(var)} as property_values"
+
+
+_NODE_PROPERTIES = _cypher_string_properties("n")
+
+
+def _string_properties(row: Dict[str, Any]) -> Dict[str, str]:
+    """Rebuild the properties map projected by _cypher_string_properties."""
+    return dict(zip(row["property_keys"] or (), row["property_values"] or ()))
+
+
+# Graph exploration fetches nodes and the relationships between them in one
+# round-trip: the node subquery picks up to $limit nodes, the relationship
+# subquery only expands from those. The query text is fixed and every filter
+# is a parameter, so Neo4j plans it once for any combination of filters.
+# The relationship subquery aggregates, so it yields a row even with no edges.
+_EXPLORE_QUERY_TEMPLATE = """
+CALL {{
+    {node_match}
+}}
+WITH collect(n) as ns, collect({{
+    id: id(n),
+    type: labels(n)[0],
+    label: CASE 
+        WHEN n:Publication THEN n.title
+        WHEN n:Entity THEN n.name
+        WHEN n:Page THEN 'Page ' + toString(n.page_number)
+        ELSE 'Unknown'
+    END,
+    property_keys: keys(n),
+    property_values: {node_values}{node_extra}
+}}) as nodes
+CALL {{
+    WITH ns
+    UNWIND ns as n
+    MATCH (n)-[r]->(m)
+    WHERE m IN ns AND ($rel_types IS NULL OR type(r) IN $rel_types)
+    WITH n, r, m
+    LIMIT $limit
+    RETURN collect({{
+        source: id(n),
+        target: id(m),
+        type: type(r),
+        property_keys: keys(r),
+        property_values: {relationship_values}
+    }}) as edges
+}}
+RETURN nodes, edges
+"""
+
+# Explorable nodes are matched with a label expression, which plans as one
+# union of label scans instead of a full node scan filtered on three labels.
+# Connectivity is COUNT { (n)--() }. With no relationship type or neighbour
+# label in the pattern it plans as GetDegree, which reads each node's degree
+# from its record rather than expanding its relationships. There is no degree
+# index, so min_connections still reads the degree of every candidate node
+# before it filters and sorts.
+_EXPLORE_NODE_FILTER = """WHERE $labels IS NULL OR any(l IN labels(n) WHERE l IN $labels)"""
+
+# The first page takes nodes in scan order so LIMIT can stop the scan early.
+# Later pages need a stable order for SKIP; Entity nodes merged by name carry
+# no entity_id, so there is no indexed key shared by every explorable node.
+_EXPLORE_QUERY = _EXPLORE_QUERY_TEMPLATE.format(
+    node_match=f"""MATCH (n:Publication|Entity|Page)
+    {_EXPLORE_NODE_FILTER}
+    RETURN n
+    LIMIT $limit""",
+    node_values=_cypher_property_values("n"),
+    node_extra="",
+    relationship_values=_cypher_property_values("r")
+)
+
+_EXPLORE_PAGED_QUERY = _EXPLORE_QUERY_TEMPLATE.format(
+    node_match=f"""MATCH (n:Publication|Entity|Page)
+    {_EXPLORE_NODE_FILTER}
+    RETURN n
+    ORDER BY elementId(n)
+    SKIP $skip
+    LIMIT $limit""",
+    node_values=_cypher_property_values("n"),
+    node_extra="",
+    relationship_values=_cypher_property_values("r")
+)
+
+_EXPLORE_CONNECTED_QUERY = _EXPLORE_QUERY_TEMPLATE.format(
+    node_match=f"""MATCH (n:Publication|Entity|Page)
+    {_EXPLORE_NODE_FILTER}
+    WITH n, COUNT {{ (n)--() }} as connections
+    WHERE connections >= $min_connections
+    RETURN n, connections
+    ORDER BY connections DESC, elementId(n)
+    SKIP $skip
+    LIMIT $limit""",
+    node_values=_cypher_property_values("n"),
+    node_extra=",\n    connections: connections",
+    relationship_values=_cypher_property_values("r")
+)
+
+
+# Total matching nodes for a filter, counted once and reused across pages
+_EXPLORE_COUNT_QUERY = f"""
+MATCH (n:Publication|Entity|Page)
+{_EXPLORE_NODE_FILTER}
+RETURN count(n) as total
+"""
+
+_EXPLORE_CONNECTED_COUNT_QUERY = f"""
+MATCH (n:Publication|Entity|Page)
+{_EXPLORE_NODE_FILTER}
+WITH n, COUNT {{ (n)--() }} as connections
+WHERE connections >= $min_connections
+RETURN count(n) as total
+"""
+
+_COUNT_CACHE_TTL = 300.0
+_COUNT_CACHE_MAX = 256
+_count_cache: Dict[Tuple[Any, ...], Tuple[float, int]] = {}
+
+
+async def _explore_total(labels: Optional[List[str]], min_connections: int) -> int:
+    """Node total for an exploration filter, cached for _COUNT_CACHE_TTL seconds."""
+    key = (tuple(labels) if labels else None, min_connections if min_connections > 0 else 0)
+    now = time.monotonic()
+    cached = _count_cache.get(key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
+    query = _EXPLORE_CONNECTED_COUNT_QUERY if min_connections > 0 else _EXPLORE_COUNT_QUERY
+    result = await neo4j_client.arun_read(query, {"labels": labels, "min_connections": min_connections})
+    total = result[0]["total"] if result else 0
+    if len(_count_cache) >= _COUNT_CACHE_MAX:
+        _count_cache.clear()
+    _count_cache[key] = (now + _COUNT_CACHE_TTL, total)
+    return total
+
+
+async def _explore(
+    labels: Optional[List[str]],
+    rel_types: Optional[List[str]],
+    min_connections: int,
+    limit: int,
+    skip: int = 0
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Run the single-round-trip exploration query; returns (node rows, edge rows)."""
+    if min_connections > 0:
+        query = _EXPLORE_CONNECTED_QUERY
+    else:
+        query = _EXPLORE_PAGED_QUERY if skip > 0 else _EXPLORE_QUERY
+    result = await neo4j_client.arun_read(query, {
+        "labels": labels,
+        "rel_types": rel_types,
+        "min_connections": min_connections,
+        "skip": skip,
+        "limit": limit
+    })
+    if not result:
+        return [], []
+    return result[0]["nodes"], result[0]["edges"]
+
+
+def _explore_nodes(rows: List[Dict[str, Any]], with_connections: bool = False) -> List[Dict[str, Any]]:
+    """Shape exploration node rows for the frontend."""
+    nodes = []
+    for row in rows:
+        node = {
+            "id": str(row["id"]),
+            "label": row["label"] or "Unknown",
+            "type": row["type"] or "Unknown",
+            "properties": _string_properties(row)
+        }
+        if with_connections:
+            node["connections"] = row.get("connections", 0)
+        nodes.append(node)
+    return nodes
+
+
+def _explore_edges(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Shape exploration relationship rows for the frontend."""
+    return [
+        {
+            "source": str(row["source"]),
+            "target": str(row["target"]),
+            "type": row["type"] or "RELATED",
+            "properties": _string_properties(row)
+        }
+        for row in rows
+    ]
+
+
+# Redis cache-aside TTLs (seconds) for the read-only graph endpoints
+_ENTITY_CACHE_TTL = 300
+_EXPLORE_CACHE_TTL = 120
+_STATS_CACHE_TTL = 60
+
+
+async def _cached_response(key: str) -> Optional[Response]:
+    """Serve a previously serialized body from the response cache, if present."""
+    body = await response_cache.get_bytes(key)
+    return None if body is None else Response(body, media_type="application/json")
+
+
+async def _cache_response(key: str, payload: Any, ttl: int) -> Response:
+    """Serialize `payload` once, store the bytes under `key` and return them."""
+    body = json_dumps(payload)
+    await response_cache.set_bytes(key, body, ttl)
+    return Response(body, media_type="application/json")
+
+
+# In-process LRU in front of Redis for the aggregate endpoints the frontend polls
+# with identical arguments (/statistics, /visualization)
+_LOCAL_CACHE_MAX = 64
+_local_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_local_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _local_hit(key: str) -> Optional[Response]:
+    entry = _local_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    _local_cache.move_to_end(key)
+    return Response(entry[1], media_type="application/json")
+
+
+async def _local_cached(key: str, ttl: int, build: Callable[[], Awaitable[Response]]) -> Response:
+    """
+    Serve `key` from this worker's memory for `ttl` seconds, otherwise await
+    `build()`. Concurrent misses on one key wait on a shared lock so only the
+    first runs the queries (no dogpile when the entry expires).
+    """
+    hit = _local_hit(key)
+    if hit is not None:
+        return hit
+
+    lock = _local_locks.setdefault(key, asyncio.Lock())
+    try:
+        async with lock:
+            hit = _local_hit(key)
+            if hit is not None:
+                return hit
+            response = await build()
+            _local_cache[key] = (time.monotonic() + ttl, response.body)
+            _local_cache.move_to_end(key)
+            while len(_local_cache) > _LOCAL_CACHE_MAX:
+                _local_cache.popitem(last=False)
+            return response
+    finally:
+        if not lock.locked():
+            _local_locks.pop(key, None)
+
+
+def clear_local_cache() -> int:
+    """Drop this worker's in-process responses; returns how many were held."""
+    cleared = len(_local_cache)
+    _local_cache.clear()
+    return cleared
 
 
 @router.get("/explore/filtered")
@@ -15,152 +301,49 @@ async def explore_graph_filtered(
     node_types: str = None,
     relationship_types: str = None,
     min_connections: int = 0,
-    limit: int = 50
+    limit: int = 50,
+    skip: int = Query(0, ge=0),
+    count: bool = False
 ):
     """
     Get filtered nodes and relationships for graph exploration.
     Supports advanced filtering by node types, relationship types, and connectivity.
+    Page with `skip`/`limit`; `count=true` adds the total number of matching nodes.
     """
     try:
-        # Parse comma-separated filter parameters
-        node_type_list = [t.strip() for t in node_types.split(',')] if node_types else []
-        rel_type_list = [t.strip() for t in relationship_types.split(',')] if relationship_types else []
-        
-        # Build dynamic query based on filters
-        node_filter = ""
-        if node_type_list:
-            labels = " OR ".join([f"n:{label}" for label in node_type_list])
-            node_filter = f"WHERE {labels}"
-        else:
-            node_filter = "WHERE n:Publication OR n:Entity OR n:Page"
-        
-        # Get nodes with connectivity filtering
-        if min_connections > 0:
-            nodes_query = f"""
-            MATCH (n)-[r]-()
-            {node_filter}
-            WITH n, count(r) as connections
-            WHERE connections >= $min_connections
-            RETURN 
-                id(n) as id,
-                labels(n)[0] as type,
-                CASE 
-                    WHEN n:Publication THEN n.title
-                    WHEN n:Entity THEN n.name
-                    WHEN n:Page THEN 'Page ' + toString(n.page_number)
-                    ELSE 'Unknown'
-                END as label,
-                properties(n) as properties,
-                connections
-            ORDER BY connections DESC
-            LIMIT $limit
-            """
-        else:
-            nodes_query = f"""
-            MATCH (n)
-            {node_filter}
-            RETURN 
-                id(n) as id,
-                labels(n)[0] as type,
-                CASE 
-                    WHEN n:Publication THEN n.title
-                    WHEN n:Entity THEN n.name
-                    WHEN n:Page THEN 'Page ' + toString(n.page_number)
-                    ELSE 'Unknown'
-                END as label,
-                properties(n) as properties
-            LIMIT $limit
-            """
-        
-        nodes_result = neo4j_client.run_query(nodes_query, {
+        key = cache_key("graph", "explore-filtered", {
+            "node_types": node_types,
+            "relationship_types": relationship_types,
             "min_connections": min_connections,
-            "limit": limit
+            "limit": limit,
+            "skip": skip,
+            "count": count
         })
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
         
-        # Get node IDs for relationship filtering
-        node_ids = [str(node["id"]) for node in nodes_result]
-        
-        # Build relationship query with filtering
-        rel_filter = ""
-        if rel_type_list:
-            rel_filter = f"AND type(r) IN {rel_type_list}"
-        
-        relationships_query = f"""
-        MATCH (n)-[r]->(m)
-        WHERE id(n) IN $node_ids AND id(m) IN $node_ids {rel_filter}
-        RETURN 
-            id(n) as source,
-            id(m) as target,
-            type(r) as type,
-            properties(r) as properties
-        LIMIT $limit
-        """
-        
-        relationships_result = neo4j_client.run_query(relationships_query, {
-            "node_ids": [int(nid) for nid in node_ids],
-            "limit": limit
-        })
+        # Parse comma-separated filter parameters
+        node_type_list = [t.strip() for t in node_types.split(',')] if node_types else []
+        rel_type_list = [t.strip() for t in relationship_types.split(',')] if relationship_types else []
         
-        # Process results with same cleaning logic as original
-        nodes = []
-        for node_data in nodes_result:
-            raw_properties = node_data["properties"] or {}
-            clean_properties = {}
-            
-            for key, value in raw_properties.items():
-                try:
-                    if value is None:
-                        clean_properties[key] = "N/A"
-                    elif isinstance(value, str):
-                        clean_properties[key] = value
-                    elif isinstance(value, (int, float, bool)):
-                        clean_properties[key] = str(value)
-                    elif isinstance(value, list):
-                        clean_properties[key] = ", ".join(str(item) for item in value if item is not None)
-                    else:
-                        clean_properties[key] = str(value)
-                except Exception:
-                    clean_properties[key] = "Invalid data"
-            
-            nodes.append({
-                "id": str(node_data["id"]),
-                "label": node_data["label"] or "Unknown",
-                "type": node_data["type"] or "Unknown",
-                "properties": clean_properties,
-                "connections": node_data.get("connections", 0)
-            })
+        nodes_result, relationships_result = await _explore(
+            node_type_list or None, rel_type_list or None, min_connections, limit, skip
+        )
+        total = await _explore_total(node_type_list or None, min_connections) if count else None
         
-        edges = []
-        for rel_data in relationships_result:
-            raw_properties = rel_data["properties"] or {}
-            clean_properties = {}
-            
-            for key, value in raw_properties.items():
-                try:
-                    if value is None:
-                        clean_properties[key] = "N/A"
-                    elif isinstance(value, str):
-                        clean_properties[key] = value
-                    elif isinstance(value, (int, float, bool)):
-                        clean_properties[key] = str(value)
-                    else:
-                        clean_properties[key] = str(value)
-                except Exception:
-                    clean_properties[key] = "Invalid data"
-            
-            edges.append({
-                "source": str(rel_data["source"]),
-                "target": str(rel_data["target"]),
-                "type": rel_data["type"] or "RELATED",
-                "properties": clean_properties
-            })
+        nodes = _explore_nodes(nodes_result, with_connections=True)
+        edges = _explore_edges(relationships_result)
         
-        return {
+        return await _cache_response(key, {
             "nodes": nodes,
             "edges": edges,
             "metadata": {
                 "total_nodes": len(nodes),
                 "total_edges": len(edges),
+                "page_size": len(nodes),
+                "skip": skip,
+                "total": total,
                 "filters_applied": {
                     "node_types": node_type_list,
                     "relationship_types": rel_type_list,
@@ -168,7 +351,7 @@ async def explore_graph_filtered(
                 },
                 "query_time_ms": 0.0
             }
-        }
+        }, _EXPLORE_CACHE_TTL)
         
     except Exception as e:
         logger.error(f"Filtered graph exploration failed: {e}")
@@ -176,149 +359,80 @@ async def explore_graph_filtered(
 
 
 @router.get("/explore")
-async def explore_graph(limit: int = 50):
+async def explore_graph(limit: int = 50, skip: int = Query(0, ge=0), count: bool = False):
     """
     Get nodes and relationships for graph exploration.
     Returns data suitable for visualization.
+    Page with `skip`/`limit`; `count=true` adds the total number of nodes.
     """
     try:
-        # Get nodes with their basic info - only real data from Neo4j
-        nodes_query = """
-        MATCH (n)
-        WHERE n:Publication OR n:Entity OR n:Page
-        RETURN 
-            id(n) as id,
-            labels(n)[0] as type,
-            CASE 
-                WHEN n:Publication THEN n.title
-                WHEN n:Entity THEN n.name
-                WHEN n:Page THEN 'Page ' + toString(n.page_number)
-                ELSE 'Unknown'
-            END as label,
-            properties(n) as properties
-        LIMIT $limit
-        """
+        key = cache_key("graph", "explore", {"limit": limit, "skip": skip, "count": count})
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
         
-        nodes_result = neo4j_client.run_query(nodes_query, {"limit": limit})
-        
-        # Get relationships between these nodes
-        relationships_query = """
-        MATCH (n)-[r]->(m)
-        WHERE (n:Publication OR n:Entity OR n:Page) AND (m:Publication OR m:Entity OR m:Page)
-        RETURN 
-            id(n) as source,
-            id(m) as target,
-            type(r) as type,
-            properties(r) as properties
-        LIMIT $limit
-        """
-        
-        relationships_result = neo4j_client.run_query(relationships_query, {"limit": limit})
-        
-        # Process nodes
-        nodes = []
-        for node_data in nodes_result:
-            # Clean properties to ensure they're serializable as strings
-            raw_properties = node_data["properties"] or {}
-            clean_properties = {}
-            
-            for key, value in raw_properties.items():
-                try:
-                    if value is None:
-                        clean_properties[key] = "N/A"
-                    elif isinstance(value, str):
-                        clean_properties[key] = value
-                    elif isinstance(value, (int, float, bool)):
-                        clean_properties[key] = str(value)
-                    elif isinstance(value, list):
-                        # Convert list items to strings
-                        clean_properties[key] = ", ".join(str(item) for item in value if item is not None)
-                    else:
-                        # Convert other types to string
-                        clean_properties[key] = str(value)
-                except Exception:
-                    clean_properties[key] = "Invalid data"
-            
-            nodes.append({
-                "id": str(node_data["id"]),
-                "label": node_data["label"] or "Unknown",
-                "type": node_data["type"] or "Unknown",
-                "properties": clean_properties
-            })
+        # Nodes and the relationships between them - only real data from Neo4j
+        nodes_result, relationships_result = await _explore(None, None, 0, limit, skip)
+        total = await _explore_total(None, 0) if count else None
         
-        # Process relationships
-        edges = []
-        for rel_data in relationships_result:
-            # Clean relationship properties too
-            raw_properties = rel_data["properties"] or {}
-            clean_properties = {}
-            
-            for key, value in raw_properties.items():
-                try:
-                    if value is None:
-                        clean_properties[key] = "N/A"
-                    elif isinstance(value, str):
-                        clean_properties[key] = value
-                    elif isinstance(value, (int, float, bool)):
-                        clean_properties[key] = str(value)
-                    else:
-                        clean_properties[key] = str(value)
-                except Exception:
-                    clean_properties[key] = "Invalid data"
-            
-            edges.append({
-                "source": str(rel_data["source"]),
-                "target": str(rel_data["target"]),
-                "type": rel_data["type"] or "RELATED",
-                "properties": clean_properties
-            })
+        nodes = _explore_nodes(nodes_result)
+        edges = _explore_edges(relationships_result)
         
-        return {
+        return await _cache_response(key, {
             "nodes": nodes,
             "edges": edges,
             "metadata": {
                 "total_nodes": len(nodes),
                 "total_edges": len(edges),
+                "page_size": len(nodes),
+                "skip": skip,
+                "total": total,
                 "query_time_ms": 0.0  # Would measure in production
             }
-        }
+        }, _EXPLORE_CACHE_TTL)
         
     except Exception as e:
         logger.error(f"Graph exploration failed: {e}")
         return {"nodes": [], "edges": [], "error": str(e)}
 
 
+_SEARCH_QUERY = f"""
+MATCH (n:Publication|Entity|Page)
+WHERE (n:Publication AND toLower(n.title) CONTAINS toLower($query))
+   OR (n:Entity AND toLower(n.name) CONTAINS toLower($query))
+   OR (n:Page AND toLower(n.text) CONTAINS toLower($query))
+WITH n
+MATCH (n)-[r]-(connected)
+RETURN 
+    id(n) as id,
+    labels(n)[0] as type,
+    CASE 
+        WHEN n:Publication THEN n.title
+        WHEN n:Entity THEN n.name
+        WHEN n:Page THEN 'Page ' + toString(n.page_number)
+        ELSE 'Unknown'
+    END as label,
+    {_NODE_PROPERTIES},
+    id(connected) as connected_id,
+    labels(connected)[0] as connected_type,
+    type(r) as relationship_type
+LIMIT $limit
+"""
+
+
 @router.get("/search")
 async def search_graph(query: str, limit: int = 30):
     """
     Search for nodes in the knowledge graph by name/title.
     """
     try:
-        # Search across different node types
-        search_query = """
-        MATCH (n)
-        WHERE (n:Publication AND toLower(n.title) CONTAINS toLower($query))
-           OR (n:Entity AND toLower(n.name) CONTAINS toLower($query))
-           OR (n:Page AND toLower(n.text) CONTAINS toLower($query))
-        WITH n
-        MATCH (n)-[r]-(connected)
-        RETURN 
-            id(n) as id,
-            labels(n)[0] as type,
-            CASE 
-                WHEN n:Publication THEN n.title
-                WHEN n:Entity THEN n.name
-                WHEN n:Page THEN 'Page ' + toString(n.page_number)
-                ELSE 'Unknown'
-            END as label,
-            properties(n) as properties,
-            id(connected) as connected_id,
-            labels(connected)[0] as connected_type,
-            type(r) as relationship_type
-        LIMIT $limit
-        """
+        key = cache_key("graph", "search", {"query": query, "limit": limit})
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
         
-        search_result = neo4j_client.run_query(search_query, {"query": query, "limit": limit})
+        # Search across different node types
+        search_result = await neo4j_client.arun_read(_SEARCH_QUERY, {"query": query, "limit": limit})
         
         # Process results to get unique nodes and relationships
         nodes = {}
@@ -328,24 +442,7 @@ async def search_graph(query: str, limit: int = 30):
             # Add main node
             node_id = str(result["id"])
             if node_id not in nodes:
-                # Clean properties for this node too
-                raw_properties = result["properties"] or {}
-                clean_properties = {}
-                
-                for key, value in raw_properties.items():
-                    try:
-                        if value is None:
-                            clean_properties[key] = "N/A"
-                        elif isinstance(value, str):
-                            clean_properties[key] = value
-                        elif isinstance(value, (int, float, bool)):
-                            clean_properties[key] = str(value)
-                        elif isinstance(value, list):
-                            clean_properties[key] = ", ".join(str(item) for item in value if item is not None)
-                        else:
-                            clean_properties[key] = str(value)
-                    except Exception:
-                        clean_properties[key] = "Invalid data"
+                clean_properties = _string_properties(result)
                 
                 nodes[node_id] = {
                     "id": node_id,
@@ -372,17 +469,42 @@ async def search_graph(query: str, limit: int = 30):
                 "properties": {}
             })
         
-        return {
+        return await _cache_response(key, {
             "nodes": list(nodes.values()),
             "relationships": relationships
-        }
+        }, _EXPLORE_CACHE_TTL)
         
     except Exception as e:
         logger.error(f"Graph search failed: {e}")
         return {"nodes": [], "relationships": []}
 
 
-@router.get("/query", response_model=KGQueryResponse)
+# Rows per streamed chunk (and per Bolt fetch) for /query results
+_QUERY_STREAM_BATCH = 500
+
+
+async def _stream_query_results(first: Optional[Any], records: AsyncIterator[Any], start_ns: int) -> AsyncIterator[bytes]:
+    """
+    Stream `{"results": [...], "execution_time_ms": ...}` straight from the open
+    Neo4j result, serializing rows in batches instead of materializing the list.
+    """
+    yield b'{"results":['
+    if first is not None:
+        separator = b""
+        batch = [json_dumps(first.data())]
+        async for record in records:
+            batch.append(json_dumps(record.data()))
+            if len(batch) >= _QUERY_STREAM_BATCH:
+                yield separator + b",".join(batch)
+                separator = b","
+                batch.clear()
+        if batch:
+            yield separator + b",".join(batch)
+    execution_time = (time.perf_counter_ns() - start_ns) / 1e6
+    yield b'],"execution_time_ms":' + json_dumps(execution_time) + b"}"
+
+
+@router.get("/query")
 async def execute_cypher_query(
     cypher_query: str,
     parameters: Optional[str] = None
@@ -392,18 +514,17 @@ async def execute_cypher_query(
     For advanced users who want to write custom queries.
     """
     try:
-        import json
-        import time
-        
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Parse parameters if provided
         params = {}
         if parameters:
             try:
-                params = json.loads(parameters)
-            except json.JSONDecodeError:
+                params = orjson.loads(parameters)
+            except orjson.JSONDecodeError:
                 raise HTTPException(status_code=400, detail="Invalid JSON parameters")
+            if not isinstance(params, dict):
+                raise HTTPException(status_code=400, detail="parameters must be a JSON object")
         
         # Execute query with safety limits
         if not _is_safe_query(cypher_query):
@@ -412,19 +533,23 @@ async def execute_cypher_query(
                 detail="Query contains potentially unsafe operations"
             )
         
-        # Add LIMIT if not present (safety measure)
-        if "LIMIT" not in cypher_query.upper() and "CREATE" not in cypher_query.upper():
-            cypher_query += " LIMIT 1000"
+        # Add LIMIT if not present (safety measure), as a parameter so the text stays plannable
+        cypher_query, has_limit = _normalize_query(cypher_query)
+        if not has_limit:
+            cypher_query += " LIMIT $__auto_limit"
+            params["__auto_limit"] = _QUERY_AUTO_LIMIT
         
-        results = neo4j_client.run_query(cypher_query, params)
+        records = neo4j_client.astream_records(cypher_query, params, fetch_size=_QUERY_STREAM_BATCH)
+        # Pull the first record here so query errors still surface as a 500
+        first = await anext(records, None)
         
-        execution_time = (time.time() - start_time) * 1000
-        
-        return KGQueryResponse(
-            results=results,
-            execution_time_ms=execution_time
+        return StreamingResponse(
+            _stream_query_results(first, records, start_ns),
+            media_type="application/json"
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Cypher query execution failed: {e}")
         raise HTTPException(status_code=500, detail=f"Query failed: {e}")
@@ -439,8 +564,19 @@ async def get_graph_visualization(
     Get knowledge graph data optimized for visualization.
     Returns nodes and edges in format suitable for Cytoscape.js
     """
+    key = cache_key("graph", "visualization", {"entity_types": entity_types, "limit": limit})
+    return await _local_cached(
+        key, _EXPLORE_CACHE_TTL, lambda: _graph_visualization(key, entity_types, limit)
+    )
+
+
+async def _graph_visualization(key: str, entity_types: Optional[List[str]], limit: int) -> Response:
     try:
-        graph_data = neo4j_client.get_knowledge_graph_data(entity_types, limit)
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
+        
+        graph_data = await neo4j_client.aget_knowledge_graph_data(entity_types, limit)
         
         # Format for Cytoscape.js
         cytoscape_data = []
@@ -471,54 +607,60 @@ async def get_graph_visualization(
                 'classes': relationship['relationship'].lower()
             })
         
-        return {
+        return await _cache_response(key, {
             'elements': cytoscape_data,
             'stats': {
                 'nodes': len(graph_data['nodes']),
                 'edges': len(graph_data['relationships'])
             }
-        }
+        }, _EXPLORE_CACHE_TTL)
         
     except Exception as e:
         logger.error(f"Graph visualization data retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"Visualization failed: {e}")
 
 
+_ENTITY_QUERY = """
+MATCH (e:Entity {entity_id: $entity_id})
+USING INDEX e:Entity(entity_id)
+RETURN e
+"""
+
+_RELATED_ENTITIES_QUERY = """
+MATCH (e:Entity {entity_id: $entity_id})-[r]-(related:Entity)
+USING INDEX e:Entity(entity_id)
+RETURN related, type(r) as relationship, r.confidence as confidence
+LIMIT 20
+"""
+
+
 @router.get("/entity/{entity_id}")
 async def get_entity_details(entity_id: str):
     """Get detailed information about a specific entity."""
     try:
-        # Get entity details
-        entity_query = """
-        MATCH (e:Entity {entity_id: $entity_id})
-        RETURN e
-        """
-        
-        entity_result = neo4j_client.run_query(entity_query, {"entity_id": entity_id})
+        key = cache_key("graph", "entity", {"entity_id": entity_id})
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
+        
+        # Entity, neighbours and mentioning publications are independent reads
+        entity_result, relations, publications = await asyncio.gather(
+            neo4j_client.arun_read(_ENTITY_QUERY, {"entity_id": entity_id}),
+            neo4j_client.arun_read(_RELATED_ENTITIES_QUERY, {"entity_id": entity_id}),
+            neo4j_client.aget_entity_publications(entity_id)
+        )
         
         if not entity_result:
             raise HTTPException(status_code=404, detail="Entity not found")
         
         entity = entity_result[0]['e']
         
-        # Get related entities
-        relations_query = """
-        MATCH (e:Entity {entity_id: $entity_id})-[r]-(related:Entity)
-        RETURN related, type(r) as relationship, r.confidence as confidence
-        LIMIT 20
-        """
-        
-        relations = neo4j_client.run_query(relations_query, {"entity_id": entity_id})
-        
-        # Get publications mentioning this entity
-        publications = neo4j_client.get_entity_publications(entity_id)
-        
-        return {
+        return await _cache_response(key, {
             'entity': entity,
             'related_entities': relations,
             'publications': publications,
             'total_mentions': len(publications)
-        }
+        }, _ENTITY_CACHE_TTL)
         
     except HTTPException:
         raise
@@ -527,23 +669,37 @@ async def get_entity_details(entity_id: str):
         raise HTTPException(status_code=500, detail=f"Entity retrieval failed: {e}")
 
 
+# Variable-length bounds can't be Cypher parameters, so the query text for each
+# allowed hop count is built once; Neo4j then caches at most _MAX_PATH_HOPS plans.
+_MAX_PATH_HOPS = 10
+_SHORTEST_PATH_QUERIES = {
+    hops: f"""
+        MATCH (source:Entity {{entity_id: $source_id}})
+        USING INDEX source:Entity(entity_id)
+        MATCH (target:Entity {{entity_id: $target_id}})
+        USING INDEX target:Entity(entity_id)
+        MATCH path = shortestPath((source)-[*1..{hops}]-(target))
+        RETURN length(path) as path_length,
+               [n IN nodes(path) | {{id: id(n), labels: labels(n), properties: properties(n)}}] as nodes,
+               [r IN relationships(path) | {{
+                   id: id(r), type: type(r), source: id(startNode(r)), target: id(endNode(r)),
+                   properties: properties(r)
+               }}] as relationships
+        LIMIT 1
+        """
+    for hops in range(1, _MAX_PATH_HOPS + 1)
+}
+
+
 @router.get("/path")
 async def find_shortest_path(
     source_entity_id: str,
     target_entity_id: str,
-    max_hops: int = 5
+    max_hops: int = Query(5, ge=1, le=_MAX_PATH_HOPS)
 ):
     """Find shortest path between two entities in the knowledge graph."""
     try:
-        path_query = """
-        MATCH path = shortestPath(
-            (source:Entity {entity_id: $source_id})-[*1..{max_hops}]-(target:Entity {entity_id: $target_id})
-        )
-        RETURN path
-        LIMIT 1
-        """.format(max_hops=max_hops)
-        
-        result = neo4j_client.run_query(path_query, {
+        result = await neo4j_client.arun_read(_SHORTEST_PATH_QUERIES[max_hops], {
             "source_id": source_entity_id,
             "target_id": target_entity_id
         })
@@ -554,20 +710,38 @@ async def find_shortest_path(
                 'message': f'No path found between entities within {max_hops} hops'
             }
         
-        # Format path for visualization
-        path_data = result[0]['path']
+        # Path arrives already flattened to plain maps by the query
+        path = result[0]
         
-        return {
+        return json_response({
             'path_found': True,
-            'path_length': len(path_data.relationships),
-            'path_data': path_data
-        }
+            'path_length': path['path_length'],
+            'path_data': {
+                'nodes': path['nodes'],
+                'relationships': path['relationships']
+            }
+        })
         
     except Exception as e:
         logger.error(f"Path finding failed: {e}")
         raise HTTPException(status_code=500, detail=f"Path finding failed: {e}")
 
 
+_CLUSTER_QUERY = """
+MATCH (e1:Entity)-[:MENTIONED_IN]->(p:Page)<-[:MENTIONED_IN]-(e2:Entity)
+USING JOIN ON p  // Expand from both entity sides and hash-join on the shared page
+WHERE e1.entity_id < e2.entity_id  // Avoid duplicate pairs
+  AND ($entity_type IS NULL OR (e1.entity_type = $entity_type AND e2.entity_type = $entity_type))
+WITH e1, e2, count(DISTINCT p) as co_occurrences
+WHERE co_occurrences >= $min_cluster_size
+RETURN e1.entity_id as entity1, e1.name as name1, e1.entity_type as type1,
+       e2.entity_id as entity2, e2.name as name2, e2.entity_type as type2,
+       co_occurrences
+ORDER BY co_occurrences DESC
+LIMIT 100
+"""
+
+
 @router.get("/clusters")
 async def get_entity_clusters(
     entity_type: Optional[str] = None,
@@ -578,29 +752,10 @@ async def get_entity_clusters(
     Useful for identifying research themes and related concepts.
     """
     try:
-        cluster_query = """
-        MATCH (e1:Entity)-[:MENTIONED_IN]->(p:Page)<-[:MENTIONED_IN]-(e2:Entity)
-        WHERE e1.entity_id < e2.entity_id  // Avoid duplicate pairs
-        {entity_filter}
-        WITH e1, e2, count(DISTINCT p) as co_occurrences
-        WHERE co_occurrences >= $min_cluster_size
-        RETURN e1.entity_id as entity1, e1.name as name1, e1.entity_type as type1,
-               e2.entity_id as entity2, e2.name as name2, e2.entity_type as type2,
-               co_occurrences
-        ORDER BY co_occurrences DESC
-        LIMIT 100
-        """
-        
-        entity_filter = ""
-        params = {"min_cluster_size": min_cluster_size}
-        
-        if entity_type:
-            entity_filter = "AND e1.entity_type = $entity_type AND e2.entity_type = $entity_type"
-            params["entity_type"] = entity_type
-        
-        final_query = cluster_query.format(entity_filter=entity_filter)
-        
-        results = neo4j_client.run_query(final_query, params)
+        results = await neo4j_client.arun_read(_CLUSTER_QUERY, {
+            "entity_type": entity_type,
+            "min_cluster_size": min_cluster_size
+        })
         
         # Build clusters using simple graph clustering
         clusters = _build_clusters(results)
@@ -616,43 +771,47 @@ async def get_entity_clusters(
         raise HTTPException(status_code=500, detail=f"Clustering failed: {e}")
 
 
+# Filter options: node types, relationship types and connectivity statistics
+_NODE_TYPES_QUERY = """
+MATCH (n:Publication|Entity|Page)
+RETURN DISTINCT labels(n)[0] as node_type, count(n) as count
+ORDER BY count DESC
+"""
+
+_RELATIONSHIP_TYPES_QUERY = """
+MATCH ()-[r]->()
+RETURN DISTINCT type(r) as relationship_type, count(r) as count
+ORDER BY count DESC
+"""
+
+_CONNECTIVITY_QUERY = """
+MATCH (n:Publication|Entity|Page)
+WITH n, COUNT { (n)--() } as connections
+RETURN 
+    min(connections) as min_connections,
+    max(connections) as max_connections,
+    avg(connections) as avg_connections,
+    percentileCont(connections, 0.5) as median_connections
+"""
+
+
 @router.get("/filter-options")
 async def get_filter_options():
     """Get available options for filtering the knowledge graph."""
     try:
-        # Get all available node types
-        node_types_query = """
-        MATCH (n)
-        WHERE n:Publication OR n:Entity OR n:Page
-        RETURN DISTINCT labels(n)[0] as node_type, count(n) as count
-        ORDER BY count DESC
-        """
-        
-        # Get all available relationship types
-        rel_types_query = """
-        MATCH ()-[r]->()
-        RETURN DISTINCT type(r) as relationship_type, count(r) as count
-        ORDER BY count DESC
-        """
-        
-        # Get connectivity statistics
-        connectivity_query = """
-        MATCH (n)
-        WHERE n:Publication OR n:Entity OR n:Page
-        OPTIONAL MATCH (n)-[r]-()
-        WITH n, count(r) as connections
-        RETURN 
-            min(connections) as min_connections,
-            max(connections) as max_connections,
-            avg(connections) as avg_connections,
-            percentileCont(connections, 0.5) as median_connections
-        """
-        
-        node_types_result = neo4j_client.run_query(node_types_query)
-        rel_types_result = neo4j_client.run_query(rel_types_query)
-        connectivity_result = neo4j_client.run_query(connectivity_query)
+        key = cache_key("graph", "filter-options", {})
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
+        
+        # Independent reads, issued concurrently
+        node_types_result, rel_types_result, connectivity_result = await asyncio.gather(
+            neo4j_client.arun_read(_NODE_TYPES_QUERY),
+            neo4j_client.arun_read(_RELATIONSHIP_TYPES_QUERY),
+            neo4j_client.arun_read(_CONNECTIVITY_QUERY)
+        )
         
-        return {
+        return await _cache_response(key, {
             "node_types": [
                 {
                     "type": result["node_type"],
@@ -673,7 +832,7 @@ async def get_filter_options():
                 "avg_connections": 0,
                 "median_connections": 0
             }
-        }
+        }, _STATS_CACHE_TTL)
         
     except Exception as e:
         logger.error(f"Filter options retrieval failed: {e}")
@@ -689,118 +848,190 @@ async def get_filter_options():
         }
 
 
+# /statistics sections, in response order
+_STATS_QUERIES = {
+    'node_counts': """
+    MATCH (n)
+    RETURN labels(n) as label, count(n) as count
+    ORDER BY count DESC
+    """,
+
+    'relationship_counts': """
+    MATCH ()-[r]->()
+    RETURN type(r) as relationship, count(r) as count
+    ORDER BY count DESC
+    """,
+
+    'entity_type_counts': """
+    MATCH (e:Entity)
+    RETURN e.entity_type as entity_type, count(e) as count
+    ORDER BY count DESC
+    """,
+
+    'connectivity': """
+    MATCH (e:Entity)
+    WITH e, COUNT { (e)--() } as degree
+    RETURN 
+        avg(degree) as avg_degree,
+        max(degree) as max_degree,
+        min(degree) as min_degree,
+        percentileCont(degree, 0.5) as median_degree
+    """
+}
+
+
 @router.get("/statistics")
 async def get_graph_statistics():
     """Get comprehensive knowledge graph statistics."""
+    key = cache_key("graph", "statistics", {})
+    return await _local_cached(key, _STATS_CACHE_TTL, lambda: _graph_statistics(key))
+
+
+async def _graph_statistics(key: str) -> Response:
     try:
-        stats_queries = {
-            'node_counts': """
-            MATCH (n)
-            RETURN labels(n) as label, count(n) as count
-            ORDER BY count DESC
-            """,
-            
-            'relationship_counts': """
-            MATCH ()-[r]->()
-            RETURN type(r) as relationship, count(r) as count
-            ORDER BY count DESC
-            """,
-            
-            'entity_type_counts': """
-            MATCH (e:Entity)
-            RETURN e.entity_type as entity_type, count(e) as count
-            ORDER BY count DESC
-            """,
-            
-            'connectivity': """
-            MATCH (e:Entity)
-            OPTIONAL MATCH (e)-[r]-()
-            WITH e, count(r) as degree
-            RETURN 
-                avg(degree) as avg_degree,
-                max(degree) as max_degree,
-                min(degree) as min_degree,
-                percentileCont(degree, 0.5) as median_degree
-            """
-        }
+        cached = await _cached_response(key)
+        if cached is not None:
+            return cached
+        
+        # Independent reads, issued concurrently; one failing only empties its section
+        results = await asyncio.gather(
+            *(neo4j_client.arun_read(query) for query in _STATS_QUERIES.values()),
+            return_exceptions=True
+        )
         
         statistics = {}
+        for stat_name, result in zip(_STATS_QUERIES, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to get {stat_name}: {result}")
+                result = []
+            statistics[stat_name] = result
         
-        for stat_name, query in stats_queries.items():
-            try:
-                results = neo4j_client.run_query(query)
-                statistics[stat_name] = results
-            except Exception as e:
-                logger.warning(f"Failed to get {stat_name}: {e}")
-                statistics[stat_name] = []
-        
-        return {
+        return await _cache_response(key, {
             'graph_statistics': statistics,
-            'generated_at': '2024-01-01T00:00:00Z'  # Would use actual timestamp
-        }
+            'generated_at': utc_timestamp()
+        }, _STATS_CACHE_TTL)
         
     except Exception as e:
         logger.error(f"Statistics retrieval failed: {e}")
         raise HTTPException(status_code=500, detail=f"Statistics failed: {e}")
 
 
+# Write/admin keywords rejected by /query, plus a single-pass tokenizer that
+# skips string literals, backtick-quoted names and comments so only real
+# keywords are checked
+_UNSAFE_KEYWORDS = frozenset({
+    'DELETE', 'REMOVE', 'SET', 'CREATE', 'MERGE',
+    'DROP', 'DETACH', 'CALL', 'LOAD'
+})
+# String literals, quoted names and comments, which keyword checks must skip over
+_CYPHER_OPAQUE = (
+    r"'(?:[^'\\]|\\.)*'"
+    r'|"(?:[^"\\]|\\.)*"'
+    r"|`[^`]*`"
+    r"|//[^\n]*"
+    r"|/\*.*?\*/"
+)
+_CYPHER_TOKEN = re.compile(_CYPHER_OPAQUE + r"|([A-Za-z_][A-Za-z0-9_]*)", re.S)
+# Single pass: opaque spans are consumed whole, so group 1 only fires on a bare keyword
+_UNSAFE_QUERY = re.compile(
+    _CYPHER_OPAQUE + r"|\b(" + "|".join(sorted(_UNSAFE_KEYWORDS)) + r")\b",
+    re.S | re.I
+)
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+# Row cap applied to /query when the caller gave no LIMIT
+_QUERY_AUTO_LIMIT = 1000
+
+
+def _normalize_query(cypher_query: str) -> Tuple[str, bool]:
+    """
+    Canonicalize query text so equivalent queries share one Neo4j plan-cache
+    entry: drop comments, collapse whitespace outside literals and strip a
+    trailing `;`. Also reports whether a LIMIT keyword is present.
+    """
+    parts = []
+    has_limit = False
+
+    def add_gap(text: str):
+        text = _WHITESPACE.sub(" ", text)
+        if text.startswith(" ") and parts and parts[-1].endswith(" "):
+            text = text[1:]
+        if text:
+            parts.append(text)
+
+    pos = 0
+    for match in _CYPHER_TOKEN.finditer(cypher_query):
+        add_gap(cypher_query[pos:match.start()])
+        token = match.group(0)
+        if token.startswith(("//", "/*")):
+            # A comment separates tokens like whitespace does
+            add_gap(" ")
+        else:
+            parts.append(token)
+            if match.group(1) is not None and token.upper() == "LIMIT":
+                has_limit = True
+        pos = match.end()
+    add_gap(cypher_query[pos:])
+
+    normalized = "".join(parts).strip()
+    while normalized.endswith(";"):
+        normalized = normalized[:-1].rstrip()
+    return normalized, has_limit
+
+
 def _is_safe_query(cypher_query: str) -> bool:
     """Check if Cypher query is safe to execute."""
-    unsafe_keywords = [
-        'DELETE', 'REMOVE', 'SET', 'CREATE', 'MERGE', 
-        'DROP', 'DETACH', 'CALL', 'LOAD'
-    ]
-    
-    query_upper = cypher_query.upper()
-    
-    for keyword in unsafe_keywords:
-        if keyword in query_upper:
+    for match in _UNSAFE_QUERY.finditer(cypher_query):
+        if match.group(1) is not None:
             return False
     
     return True
 
 
 def _build_clusters(co_occurrence_data: List[Dict]) -> List[Dict]:
-    """Build entity clusters from co-occurrence data."""
-    # Simple clustering based on connected components
-    from collections import defaultdict
+    """Build entity clusters (connected components) from co-occurrence data."""
+    # Union-find over small ints assigned in order of first appearance
+    ids: Dict[str, int] = {}
+    entities = []
+    parent: List[int] = []
+    
+    def index(entity_id: str, name: str, entity_type: str) -> int:
+        i = ids.get(entity_id)
+        if i is None:
+            i = ids[entity_id] = len(parent)
+            parent.append(i)
+            entities.append({'entity_id': entity_id, 'name': name, 'type': entity_type})
+        return i
     
-    graph = defaultdict(set)
-    entities = {}
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]  # Path halving
+            i = parent[i]
+        return i
     
-    # Build adjacency graph
     for item in co_occurrence_data:
-        e1, e2 = item['entity1'], item['entity2']
-        graph[e1].add(e2)
-        graph[e2].add(e1)
-        entities[e1] = {'name': item['name1'], 'type': item['type1']}
-        entities[e2] = {'name': item['name2'], 'type': item['type2']}
+        root1 = find(index(item['entity1'], item['name1'], item['type1']))
+        root2 = find(index(item['entity2'], item['name2'], item['type2']))
+        if root1 != root2:
+            # Attach the later root under the earlier one so components keep first-seen order
+            if root1 < root2:
+                parent[root2] = root1
+            else:
+                parent[root1] = root2
     
-    # Find connected components
-    visited = set()
-    clusters = []
+    members: Dict[int, List[Dict]] = {}
+    for i, entity in enumerate(entities):
+        members.setdefault(find(i), []).append(entity)
     
-    for entity_id in graph:
-        if entity_id not in visited:
-            cluster = []
-            stack = [entity_id]
-            
-            while stack:
-                current = stack.pop()
-                if current not in visited:
-                    visited.add(current)
-                    cluster.append({
-                        'entity_id': current,
-                        'name': entities[current]['name'],
-                        'type': entities[current]['type']
-                    })
-                    stack.extend(graph[current] - visited)
-            
-            if len(cluster) > 1:  # Only include clusters with multiple entities
-                clusters.append({
-                    'cluster_id': len(clusters),
-                    'entities': cluster,
-                    'size': len(cluster)
-                })
+    clusters = []
+    for cluster in members.values():
+        if len(cluster) > 1:  # Only include clusters with multiple entities
+            clusters.append({
+                'cluster_id': len(clusters),
+                'entities': cluster,
+                'size': len(cluster)
+            })
     
-    return sorted(clusters, key=lambda x: x['size'], reverse=True)
\ No newline at end of file
+    return sorted(clusters, key=lambda x: x['size'], reverse=True)
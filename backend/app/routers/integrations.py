@@ -184,7 +184,7 @@ async def create_miro_research_workspace(
                collect(DISTINCT f{.finding_id, .description, .confidence}) as findings
         """
         
-        result = neo4j_client.run_query(research_query, {"research_id": request.research_id})
+        result = await neo4j_client.arun_query(research_query, {"research_id": request.research_id})
         
         if not result:
             raise HTTPException(status_code=404, detail="Research not found")
@@ -297,7 +297,7 @@ async def get_multi_platform_research_insights(
         RETURN r, collect(p) as publications
         """
         
-        base_data = neo4j_client.run_query(research_query, {"research_id": research_id})
+        base_data = await neo4j_client.arun_query(research_query, {"research_id": research_id})
         
         if not base_data:
             raise HTTPException(status_code=404, detail="Research not found")
@@ -150,7 +150,7 @@ async def get_research_insights(
         
         keywords = keyword_map.get(mission_type, ["space", "bio"])
         
-        results = neo4j_client.run_query(
+        results = await neo4j_client.arun_query(
             insights_query,
             keyword1=keywords[0],
             keyword2=keywords[1] if len(keywords) > 1 else keywords[0],
@@ -54,7 +54,7 @@ async def semantic_search(request: SemanticSearchRequest = None, query: str = No
             ORDER BY COALESCE(p.year, 2024) DESC
             LIMIT $top_k
             """
-            results = neo4j_client.run_query(page_query, {
+            results = await neo4j_client.arun_query(page_query, {
                 "query": request.query,
                 "top_k": request.top_k
             })
@@ -82,7 +82,7 @@ async def semantic_search(request: SemanticSearchRequest = None, query: str = No
                 ORDER BY p.year DESC
                 LIMIT $top_k
                 """
-                results = neo4j_client.run_query(pub_query, {
+                results = await neo4j_client.arun_query(pub_query, {
                     "query": request.query,
                     "top_k": request.top_k
                 })
@@ -110,7 +110,7 @@ async def semantic_search(request: SemanticSearchRequest = None, query: str = No
                 ORDER BY e.name
                 LIMIT $top_k
                 """
-                results = neo4j_client.run_query(entity_query, {
+                results = await neo4j_client.arun_query(entity_query, {
                     "query": request.query,
                     "top_k": request.top_k
                 })
@@ -251,7 +251,7 @@ async def boolean_search(
         LIMIT $top_k
         """
         
-        results = neo4j_client.run_query(cypher_query, params)
+        results = await neo4j_client.arun_query(cypher_query, params)
         
         # Format results
         formatted_results = []
@@ -309,7 +309,7 @@ async def get_search_suggestions(query: str = Query(..., alias="q"), limit: int
         LIMIT $limit
         """
         
-        entity_results = neo4j_client.run_query(
+        entity_results = await neo4j_client.arun_query(
             entity_query, 
             {"query": query, "limit": limit // 2}
         )
@@ -323,7 +323,7 @@ async def get_search_suggestions(query: str = Query(..., alias="q"), limit: int
         LIMIT $limit
         """
         
-        pub_results = neo4j_client.run_query(
+        pub_results = await neo4j_client.arun_query(
             pub_query, 
             {"query": query, "limit": limit // 2}
         )
@@ -378,7 +378,7 @@ async def get_available_filters():
         ORDER BY count DESC
         LIMIT 50
         """
-        organisms = neo4j_client.run_query(organisms_query)
+        organisms = await neo4j_client.arun_query(organisms_query)
         
         # Get endpoint options  
         endpoints_query = """
@@ -387,7 +387,7 @@ async def get_available_filters():
         ORDER BY count DESC
         LIMIT 50
         """
-        endpoints = neo4j_client.run_query(endpoints_query)
+        endpoints = await neo4j_client.arun_query(endpoints_query)
         
         # Get year range
         year_query = """
@@ -395,7 +395,7 @@ async def get_available_filters():
         WHERE p.year IS NOT NULL
         RETURN min(p.year) as min_year, max(p.year) as max_year
         """
-        year_result = neo4j_client.run_query(year_query)
+        year_result = await neo4j_client.arun_query(year_query)
         year_range = year_result[0] if year_result else {"min_year": 2000, "max_year": 2024}
         
         return {
@@ -425,7 +425,7 @@ async def get_search_stats():
             count(DISTINCT e) as entities
         """
         
-        result = neo4j_client.run_query(stats_query)
+        result = await neo4j_client.arun_query(stats_query)
         stats = result[0] if result else {"publications": 0, "pages": 0, "entities": 0}
         
         return {
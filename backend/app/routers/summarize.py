@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from typing import List, Optional
+import asyncio
 import logging
 import openai
 import os
@@ -33,10 +34,10 @@ async def generate_rag_summary(request: RAGRequest):
         
         if request.pub_ids:
             # Search within specific publications
-            passages = _get_passages_from_publications(request.pub_ids, request.question)
+            passages = await asyncio.to_thread(_get_passages_from_publications, request.pub_ids, request.question)
         else:
             # Semantic search across all documents
-            passages = _get_passages_from_semantic_search(request.question, request.top_k_pages)
+            passages = await asyncio.to_thread(_get_passages_from_semantic_search, request.question, request.top_k_pages)
         
         if not passages:
             return RAGResponse(
@@ -44,7 +45,7 @@ async def generate_rag_summary(request: RAGRequest):
                 citations=[],
                 confidence=0.0,
                 insufficient_evidence=True,
-                candidate_sources=_get_candidate_sources(request.question)
+                candidate_sources=await asyncio.to_thread(_get_candidate_sources, request.question)
             )
         
         # Step 2: Generate answer with LLM
@@ -75,7 +76,7 @@ async def get_publication_summary(pub_id: str):
     """Get AI-generated summary for a specific publication."""
     try:
         # Get publication data
-        pub_data = neo4j_client.get_publication(pub_id)
+        pub_data = await asyncio.to_thread(neo4j_client.get_publication, pub_id)
         
         if not pub_data:
             raise HTTPException(status_code=404, detail="Publication not found")
@@ -106,7 +107,7 @@ async def get_publication_summary(pub_id: str):
         LIMIT 20
         """
         
-        entities = neo4j_client.run_query(entities_query, {"pub_id": pub_id})
+        entities = await neo4j_client.arun_query(entities_query, {"pub_id": pub_id})
         
         return {
             'pub_id': pub_id,
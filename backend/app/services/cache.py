@@ -0,0 +1,127 @@
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+
+from ..config import settings
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Optional: without redis every lookup is a miss
+    aioredis = None
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(namespace: str, name: str, params: Dict[str, Any]) -> str:
+    """Build `<namespace>:<name>:<hash>` from an endpoint name and its query parameters."""
+    digest = hashlib.blake2b(
+        orjson.dumps(params, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str),
+        digest_size=16
+    ).hexdigest()
+    return f"{namespace}:{name}:{digest}"
+
+
+class ResponseCache:
+    """
+    Cache-aside store for already-serialized response bodies in Redis.
+
+    Every operation degrades to a miss/no-op when Redis is not installed, not
+    reachable or errors, so callers always fall through to Neo4j.
+    """
+
+    def __init__(self):
+        self.url = settings.redis_url
+        self.client = None
+        self.connected = False
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+
+    async def connect(self):
+        """Connect to Redis (Memorystore in production) and verify with PING."""
+        if aioredis is None:
+            logger.info("redis package not installed; response cache disabled")
+            return
+        try:
+            # Short timeouts so a slow cache never costs more than the query it fronts
+            self.client = aioredis.from_url(
+                self.url,
+                socket_connect_timeout=1,
+                socket_timeout=0.5,
+                health_check_interval=30
+            )
+            await self.client.ping()
+            self.connected = True
+            logger.info(f"Connected to Redis at {self.url}")
+        except Exception as e:
+            logger.warning(f"Redis unavailable, response cache disabled: {e}")
+            self.connected = False
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self.client is not None:
+            await self.client.aclose()
+        self.connected = False
+
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Return the cached body for `key`, or None on a miss."""
+        if not self.connected:
+            return None
+        try:
+            value = await self.client.get(key)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis get failed for {key}: {e}")
+            return None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set_bytes(self, key: str, value: bytes, ttl: int):
+        """Store `value` under `key` for `ttl` seconds."""
+        if not self.connected:
+            return
+        try:
+            await self.client.set(key, value, ex=ttl)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis set failed for {key}: {e}")
+
+    async def invalidate(self, prefix: str) -> int:
+        """Delete every key starting with `prefix` (e.g. after new data is loaded)."""
+        if not self.connected:
+            return 0
+        deleted = 0
+        try:
+            batch = []
+            async for key in self.client.scan_iter(match=f"{prefix}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    deleted += await self.client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                deleted += await self.client.unlink(*batch)
+        except Exception as e:
+            self.errors += 1
+            logger.warning(f"Redis invalidation failed for {prefix}*: {e}")
+        return deleted
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this worker process."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": "redis",
+            "connected": self.connected,
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+
+# Global response cache instance
+response_cache = ResponseCache()
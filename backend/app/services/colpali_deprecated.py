@@ -14,12 +14,28 @@ except ImportError:
 
 from PIL import Image
 import numpy as np
-from typing import List, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Union
 import logging
 import os
 
 logger = logging.getLogger(__name__)
 
+# Threads decoding page images ahead of the encoder (PIL releases the GIL while decoding)
+_IMAGE_LOAD_WORKERS = 8
+
+
+def _load_page_image(page_data: dict) -> Optional[Image.Image]:
+    """Open and decode a page image; None when the page has none or it fails to load."""
+    image_path = page_data.get('image_path')
+    if not image_path or not os.path.exists(image_path):
+        return None
+    try:
+        return Image.open(image_path).convert('RGB')
+    except Exception as e:
+        logger.error(f"Failed to load page image {image_path}: {e}")
+        return None
+
 
 class ColPaliService:
     def __init__(self, fallback_to_cpu: bool = True):
@@ -106,6 +122,61 @@ class ColPaliService:
             # Fallback to text-only if image processing fails
             return self._encode_with_fallback(text)
     
+    def encode_batch(self, images: List[Image.Image], texts: List[str], batch_size: int = 8) -> np.ndarray:
+        """
+        Generate multimodal embeddings for many (image, text) pairs, running the
+        model on `batch_size` pairs per forward pass. Returns a (n, dim) array.
+        """
+        if not images:
+            return np.zeros((0, self.embedding_dim), dtype=np.float32)
+        if not self.enabled:
+            logger.warning("ColPali service is disabled - returning zero embeddings")
+            return np.zeros((len(images), self.embedding_dim), dtype=np.float32)
+        if self.model is None:
+            if self.fallback_model is None:
+                raise Exception("No embedding model available")
+            return self.fallback_model.encode(
+                texts, batch_size=batch_size, normalize_embeddings=True
+            ).astype(np.float32)
+        
+        batches = []
+        for i in range(0, len(images), batch_size):
+            batch_images = images[i:i + batch_size]
+            batch_texts = texts[i:i + batch_size]
+            try:
+                batches.append(self._encode_batch_with_colpali(batch_images, batch_texts))
+            except Exception as e:
+                logger.error(f"ColPali batch encoding failed, encoding pages one by one: {e}")
+                batches.append(np.stack([
+                    self._encode_with_colpali(image, text)
+                    for image, text in zip(batch_images, batch_texts)
+                ]))
+        return np.concatenate(batches)
+    
+    def _encode_batch_with_colpali(self, images: List[Image.Image], texts: List[str]) -> np.ndarray:
+        """One ColPali forward pass over a padded batch."""
+        inputs = self.processor(
+            images=images,
+            text=texts,
+            return_tensors="pt",
+            padding=True,
+            truncation=True
+        ).to(self.device)
+        
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+            hidden = outputs.last_hidden_state
+            mask = inputs.get("attention_mask")
+            if mask is None:
+                embeddings = hidden.mean(dim=1)
+            else:
+                # Pool over real tokens only so padding doesn't depend on batch-mates
+                mask = mask.unsqueeze(-1).to(hidden.dtype)
+                embeddings = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+        
+        embeddings_np = embeddings.cpu().numpy().astype(np.float32)
+        return embeddings_np / np.linalg.norm(embeddings_np, axis=1, keepdims=True)
+    
     def _encode_with_fallback(self, text: str) -> np.ndarray:
         """Encode using fallback sentence transformer (text-only)."""
         try:
@@ -147,30 +218,51 @@ class ColPaliService:
         return self._encode_with_fallback(query)
     
     def batch_encode_pages(self, pages_data: List[dict], batch_size: int = 8) -> List[np.ndarray]:
-        """Batch encode multiple pages for efficiency."""
+        """
+        Batch encode multiple pages for efficiency. The next batch's images are
+        decoded on a bounded thread pool while the current batch is encoded.
+        """
         embeddings = []
         
-        for i in range(0, len(pages_data), batch_size):
-            batch = pages_data[i:i + batch_size]
-            batch_embeddings = []
+        with ThreadPoolExecutor(max_workers=_IMAGE_LOAD_WORKERS) as pool:
+            pending = [pool.submit(_load_page_image, page_data) for page_data in pages_data[:batch_size]]
             
-            for page_data in batch:
-                try:
-                    if 'image_path' in page_data and os.path.exists(page_data['image_path']):
-                        image = Image.open(page_data['image_path']).convert('RGB')
-                        embedding = self.encode_image_and_text(image, page_data['text'])
-                    else:
-                        embedding = self.encode_query(page_data['text'])
-                    
-                    batch_embeddings.append(embedding)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to encode page: {e}")
-                    # Add zero embedding for failed pages
-                    batch_embeddings.append(np.zeros(self.embedding_dim, dtype=np.float32))
-            
-            embeddings.extend(batch_embeddings)
-            logger.info(f"Encoded batch {i//batch_size + 1}/{(len(pages_data)-1)//batch_size + 1}")
+            for i in range(0, len(pages_data), batch_size):
+                batch = pages_data[i:i + batch_size]
+                images = [future.result() for future in pending]
+                pending = [
+                    pool.submit(_load_page_image, page_data)
+                    for page_data in pages_data[i + batch_size:i + 2 * batch_size]
+                ]
+                batch_embeddings: List[Optional[np.ndarray]] = [None] * len(batch)
+                
+                # Pages with an image share one multimodal forward pass
+                with_image = [j for j, image in enumerate(images) if image is not None]
+                if with_image:
+                    try:
+                        encoded = self.encode_batch(
+                            [images[j] for j in with_image],
+                            [batch[j]['text'] for j in with_image],
+                            batch_size=batch_size
+                        )
+                        for j, embedding in zip(with_image, encoded):
+                            batch_embeddings[j] = embedding
+                    except Exception as e:
+                        logger.error(f"Failed to encode page batch: {e}")
+                
+                # Text-only pages, and pages whose image failed to load or encode
+                for j, page_data in enumerate(batch):
+                    if batch_embeddings[j] is not None:
+                        continue
+                    try:
+                        batch_embeddings[j] = self.encode_query(page_data['text'])
+                    except Exception as e:
+                        logger.error(f"Failed to encode page: {e}")
+                        # Add zero embedding for failed pages
+                        batch_embeddings[j] = np.zeros(self.embedding_dim, dtype=np.float32)
+                
+                embeddings.extend(batch_embeddings)
+                logger.info(f"Encoded batch {i//batch_size + 1}/{(len(pages_data)-1)//batch_size + 1}")
         
         return embeddings
 
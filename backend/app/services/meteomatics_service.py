@@ -8,6 +8,8 @@ import os
 import logging
 from typing import Dict, List, Optional
 
+from .neo4j_client import neo4j_client
+
 logger = logging.getLogger(__name__)
 
 class MeteomaticsService:
@@ -71,8 +73,6 @@ class MeteomaticsService:
     async def analyze_research_environment_correlation(self, pub_id: str) -> Dict:
         """Analyze correlation between research findings and environmental conditions"""
         try:
-            from ..services.neo4j_client import neo4j_client
-            
             # Get publication details
             pub_query = """
             MATCH (p:Publication {pub_id: $pub_id})
@@ -135,8 +135,6 @@ class MeteomaticsService:
     async def _store_environmental_context(self, pub_id: str, env_context: Dict, correlations: Dict):
         """Store environmental context in Neo4j"""
         try:
-            from ..services.neo4j_client import neo4j_client
-            
             query = """
             MATCH (p:Publication {pub_id: $pub_id})
             MERGE (e:EnvironmentalContext {
@@ -32,9 +32,8 @@ class MilvusClient:
         self.collection = None
         self.connected = False
         
-        if MILVUS_AVAILABLE and self.uri:
-            self.connect()
-        else:
+        # connect() is called from the API startup hook, not at import time
+        if not (MILVUS_AVAILABLE and self.uri):
             logger.warning("Milvus not available or not configured - using mock client")
 
     def connect(self):
@@ -7,6 +7,8 @@ import logging
 from typing import Dict, List, Optional, Any
 from datetime import datetime
 
+from .neo4j_client import neo4j_client
+
 logger = logging.getLogger(__name__)
 
 class MiroCollaborationService:
@@ -357,10 +359,7 @@ class MiroCollaborationService:
     async def sync_research_updates(self, board_id: str, research_id: str):
         """Sync BioNexus research updates to Miro board"""
         try:
-            # Get latest research data from BioNexus
-            from ..services.neo4j_client import neo4j_client
-            
-            # Fetch updated research data
+            # Get latest research data from BioNexus (fetch updated research data)
             query = """
             MATCH (r:Research {research_id: $research_id})
             OPTIONAL MATCH (r)-[:HAS_PUBLICATION]->(p:Publication)
@@ -1,6 +1,7 @@
 import os
-from neo4j import GraphDatabase
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from neo4j import READ_ACCESS, AsyncGraphDatabase, GraphDatabase, Record, Session
+from typing import List, Dict, Any, AsyncIterator, Iterator, Optional
 import logging
 
 from ..config import settings
@@ -8,34 +9,80 @@ from ..config import settings
 logger = logging.getLogger(__name__)
 
 
+_KNOWLEDGE_GRAPH_NODES_QUERY = """
+MATCH (e:Entity)
+WHERE $entity_types IS NULL OR e.entity_type IN $entity_types
+RETURN e.entity_id as id, e.name as name, e.entity_type as type
+LIMIT $limit
+"""
+
+_KNOWLEDGE_GRAPH_RELATIONSHIPS_QUERY = """
+MATCH (source:Entity)-[r]->(target:Entity)
+WHERE source.entity_id IN $entity_ids AND target.entity_id IN $entity_ids
+RETURN source.entity_id as source, target.entity_id as target, 
+       type(r) as relationship, r.confidence as confidence
+"""
+
+_ENTITY_PUBLICATIONS_QUERY = """
+MATCH (e:Entity {entity_id: $entity_id})-[:MENTIONED_IN]->(pg:Page)-[:PART_OF]->(p:Publication)
+USING INDEX e:Entity(entity_id)
+RETURN DISTINCT p.pub_id as pub_id, p.title as title, p.authors as authors, p.year as year
+ORDER BY p.year DESC
+"""
+
+
 class Neo4jClient:
     def __init__(self):
         self.uri = settings.neo4j_uri
         self.user = settings.neo4j_user
         self.password = settings.neo4j_password
         self.driver = None
+        self.async_driver = None
         self.connected = False
-        self.connect()
+
+    def _driver_config(self) -> Dict[str, Any]:
+        """Pool settings shared by the sync and async drivers (NEO4J_POOL_SIZE, NEO4J_ACQ_TIMEOUT_S)."""
+        config = {
+            "max_connection_pool_size": settings.neo4j_pool_size,
+            "connection_acquisition_timeout": settings.neo4j_acq_timeout_s
+        }
+        if self.uri.startswith("neo4j+s://"):
+            # Neo4j Aura closes idle connections; recycle ours before it does
+            config["max_connection_lifetime"] = 30 * 60  # 30 minutes
+        return config
+
+    @staticmethod
+    def _pool_usage(driver) -> Optional[Dict[str, int]]:
+        # The driver has no public pool API; read its private pool defensively
+        pool = getattr(driver, "_pool", None)
+        if pool is None:
+            return None
+        try:
+            addresses = list(pool.connections)
+            return {
+                "in_use": sum(pool.in_use_connection_count(address) for address in addresses),
+                "open": sum(len(pool.connections[address]) for address in addresses)
+            }
+        except Exception:
+            return None
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """In-use/open connection counts for both drivers, for tuning the pool size."""
+        return {
+            "max_pool_size": settings.neo4j_pool_size,
+            "acquisition_timeout_s": settings.neo4j_acq_timeout_s,
+            "sync": self._pool_usage(self.driver),
+            "async": self._pool_usage(self.async_driver)
+        }
 
     def connect(self):
         """Establish connection to Neo4j Aura database."""
         try:
-            # Configure connection for Neo4j Aura with TLS
-            if self.uri.startswith("neo4j+s://"):
-                # Neo4j Aura connection with SSL
-                self.driver = GraphDatabase.driver(
-                    self.uri,
-                    auth=(self.user, self.password),
-                    max_connection_lifetime=30 * 60,  # 30 minutes
-                    max_connection_pool_size=50,
-                    connection_acquisition_timeout=60  # 60 seconds
-                )
-            else:
-                # Fallback for local development
-                self.driver = GraphDatabase.driver(
-                    self.uri, 
-                    auth=(self.user, self.password)
-                )
+            self.driver = GraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                **self._driver_config()
+            )
             
             # Test connection
             with self.driver.session() as session:
@@ -56,6 +103,29 @@ class Neo4jClient:
         if self.driver:
             self.driver.close()
 
+    async def aclose(self):
+        """Close both the async and the sync driver."""
+        if self.async_driver is not None:
+            await self.async_driver.close()
+            self.async_driver = None
+        self.close()
+
+    def _get_async_driver(self):
+        """
+        Build the AsyncGraphDatabase driver on first use. It is created lazily
+        rather than in connect() because connect() runs in a worker thread and
+        the async driver's pool must belong to the serving event loop.
+        """
+        if not self.connected:
+            raise Exception("Neo4j driver not initialized")
+        if self.async_driver is None:
+            self.async_driver = AsyncGraphDatabase.driver(
+                self.uri,
+                auth=(self.user, self.password),
+                **self._driver_config()
+            )
+        return self.async_driver
+
     def run_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """Run a Cypher query and return results."""
         if not self.driver:
@@ -69,6 +139,110 @@ class Neo4jClient:
             logger.error(f"Query execution failed: {e}")
             raise
 
+    async def arun_query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Run a Cypher query on the async driver so endpoints await Bolt I/O instead of blocking."""
+        driver = self._get_async_driver()
+
+        try:
+            async with driver.session() as session:
+                result = await session.run(query, parameters or {})
+                return [record.data() async for record in result]
+        except Exception as e:
+            logger.error(f"Query execution failed: {e}")
+            raise
+
+    @staticmethod
+    def _read_records(tx, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [record.data() for record in tx.run(query, parameters)]
+
+    @staticmethod
+    async def _aread_records(tx, query: str, parameters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        result = await tx.run(query, parameters)
+        return [record.data() async for record in result]
+
+    def run_read(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """
+        Run a read-only Cypher query in a managed read transaction. READ access
+        lets the routing driver send it to any cluster member rather than the
+        leader, and transient failures are retried by the driver.
+        """
+        if not self.driver:
+            raise Exception("Neo4j driver not initialized")
+
+        try:
+            with self.driver.session(default_access_mode=READ_ACCESS) as session:
+                return session.execute_read(self._read_records, query, parameters or {})
+        except Exception as e:
+            logger.error(f"Read query execution failed: {e}")
+            raise
+
+    async def arun_read(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+        """Async counterpart of run_read on the async driver."""
+        driver = self._get_async_driver()
+
+        try:
+            async with driver.session(default_access_mode=READ_ACCESS) as session:
+                return await session.execute_read(self._aread_records, query, parameters or {})
+        except Exception as e:
+            logger.error(f"Read query execution failed: {e}")
+            raise
+
+    def stream_query(self, query: str, parameters: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """Run a Cypher query and yield records as the driver receives them."""
+        if not self.driver:
+            raise Exception("Neo4j driver not initialized")
+
+        with self.driver.session() as session:
+            result = session.run(query, parameters or {})
+            for record in result:
+                yield record.data()
+
+    def stream_records(
+        self,
+        query: str,
+        parameters: Dict[str, Any] = None,
+        fetch_size: int = 1000,
+        read_only: bool = False
+    ) -> Iterator[Record]:
+        """
+        Run a Cypher query and yield the driver's Record objects as they arrive.
+        Records are tuples with keys()/values(), so bulk exports skip the per-row
+        dict that record.data() builds. `fetch_size` sets rows pulled per round-trip;
+        `read_only` opens a READ session that the server refuses writes on.
+        """
+        if not self.driver:
+            raise Exception("Neo4j driver not initialized")
+
+        session_config = {"default_access_mode": READ_ACCESS} if read_only else {}
+        with self.driver.session(fetch_size=fetch_size, **session_config) as session:
+            yield from session.run(query, parameters or {})
+
+    async def astream_records(
+        self,
+        query: str,
+        parameters: Dict[str, Any] = None,
+        fetch_size: int = 1000
+    ) -> AsyncIterator[Record]:
+        """Async counterpart of stream_records on a READ session of the async driver."""
+        driver = self._get_async_driver()
+
+        async with driver.session(default_access_mode=READ_ACCESS, fetch_size=fetch_size) as session:
+            result = await session.run(query, parameters or {})
+            async for record in result:
+                yield record
+
+    @contextmanager
+    def read_session(self, fetch_size: int = 1000) -> Iterator[Session]:
+        """
+        READ session for streaming several queries back to back over one
+        connection; each session.run() result is pulled in `fetch_size` batches.
+        """
+        if not self.driver:
+            raise Exception("Neo4j driver not initialized")
+
+        with self.driver.session(default_access_mode=READ_ACCESS, fetch_size=fetch_size) as session:
+            yield session
+
     def create_constraints(self):
         """Create database constraints and indexes."""
         constraints = [
@@ -79,6 +253,7 @@ class Neo4jClient:
             "CREATE CONSTRAINT IF NOT EXISTS FOR (d:Dataset) REQUIRE d.dataset_id IS UNIQUE",
             "CREATE INDEX IF NOT EXISTS FOR (p:Publication) ON (p.year)",
             "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.entity_type)",
+            "CREATE INDEX IF NOT EXISTS FOR (e:Entity) ON (e.entity_type, e.name)",
             "CREATE INDEX IF NOT EXISTS FOR (pg:Page) ON (pg.page_number)"
         ]
         
@@ -153,7 +328,9 @@ class Neo4jClient:
         """Create a relationship between entities."""
         query = f"""
         MATCH (source:Entity {{entity_id: $source_entity_id}})
+        USING INDEX source:Entity(entity_id)
         MATCH (target:Entity {{entity_id: $target_entity_id}})
+        USING INDEX target:Entity(entity_id)
         CREATE (source)-[:{rel_data['relationship_type']} {{
             confidence: $confidence,
             evidence: $evidence,
@@ -183,7 +360,7 @@ class Neo4jClient:
         ORDER BY similarity DESC
         LIMIT $top_k
         """
-        return self.run_query(query, {"embedding": embedding, "top_k": top_k})
+        return self.run_read(query, {"embedding": embedding, "top_k": top_k})
 
     def get_publication(self, pub_id: str) -> Optional[Dict[str, Any]]:
         """Get publication details with pages."""
@@ -192,32 +369,25 @@ class Neo4jClient:
         OPTIONAL MATCH (pg:Page)-[:PART_OF]->(p)
         RETURN p, collect(pg) as pages
         """
-        result = self.run_query(query, {"pub_id": pub_id})
+        result = self.run_read(query, {"pub_id": pub_id})
         return result[0] if result else None
 
     def get_knowledge_graph_data(self, entity_types: List[str] = None, limit: int = 100) -> Dict[str, Any]:
         """Get knowledge graph nodes and relationships for visualization."""
-        entity_filter = ""
-        if entity_types:
-            entity_filter = f"WHERE e.entity_type IN {entity_types}"
-            
-        nodes_query = f"""
-        MATCH (e:Entity)
-        {entity_filter}
-        RETURN e.entity_id as id, e.name as name, e.entity_type as type
-        LIMIT $limit
-        """
-        
-        relationships_query = """
-        MATCH (source:Entity)-[r]->(target:Entity)
-        WHERE source.entity_id IN $entity_ids AND target.entity_id IN $entity_ids
-        RETURN source.entity_id as source, target.entity_id as target, 
-               type(r) as relationship, r.confidence as confidence
-        """
+        nodes = self.run_read(_KNOWLEDGE_GRAPH_NODES_QUERY, {"entity_types": entity_types or None, "limit": limit})
+        entity_ids = [node["id"] for node in nodes]
+        relationships = self.run_read(_KNOWLEDGE_GRAPH_RELATIONSHIPS_QUERY, {"entity_ids": entity_ids})
         
-        nodes = self.run_query(nodes_query, {"limit": limit})
+        return {
+            "nodes": nodes,
+            "relationships": relationships
+        }
+
+    async def aget_knowledge_graph_data(self, entity_types: List[str] = None, limit: int = 100) -> Dict[str, Any]:
+        """Async counterpart of get_knowledge_graph_data."""
+        nodes = await self.arun_read(_KNOWLEDGE_GRAPH_NODES_QUERY, {"entity_types": entity_types or None, "limit": limit})
         entity_ids = [node["id"] for node in nodes]
-        relationships = self.run_query(relationships_query, {"entity_ids": entity_ids})
+        relationships = await self.arun_read(_KNOWLEDGE_GRAPH_RELATIONSHIPS_QUERY, {"entity_ids": entity_ids})
         
         return {
             "nodes": nodes,
@@ -226,12 +396,11 @@ class Neo4jClient:
 
     def get_entity_publications(self, entity_id: str) -> List[Dict[str, Any]]:
         """Get publications that mention a specific entity."""
-        query = """
-        MATCH (e:Entity {entity_id: $entity_id})-[:MENTIONED_IN]->(pg:Page)-[:PART_OF]->(p:Publication)
-        RETURN DISTINCT p.pub_id as pub_id, p.title as title, p.authors as authors, p.year as year
-        ORDER BY p.year DESC
-        """
-        return self.run_query(query, {"entity_id": entity_id})
+        return self.run_read(_ENTITY_PUBLICATIONS_QUERY, {"entity_id": entity_id})
+
+    async def aget_entity_publications(self, entity_id: str) -> List[Dict[str, Any]]:
+        """Async counterpart of get_entity_publications."""
+        return await self.arun_read(_ENTITY_PUBLICATIONS_QUERY, {"entity_id": entity_id})
 
 
 # Global client instance
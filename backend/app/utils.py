@@ -0,0 +1,78 @@
+"""
+Small shared helpers for BioNexus backend
+"""
+import base64
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+import orjson
+from fastapi.responses import Response
+from neo4j import time as neo4j_time
+from neo4j.graph import Node, Path, Relationship
+from neo4j.spatial import CartesianPoint, Point, WGS84Point
+
+# [epoch second, formatted timestamp] - reused for every call within that second
+_ts_cache = [0, ""]
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO-8601 string, formatted at most once per second."""
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache[:] = [now, datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")]
+    return _ts_cache[1]
+
+
+def _encode_path(path: Path) -> Dict[str, Any]:
+    return {"nodes": list(path.nodes), "relationships": list(path.relationships)}
+
+
+def _encode_bytes(value: bytes) -> str:
+    return base64.b64encode(value).decode("ascii")
+
+
+def _encode_point(point: Point) -> Dict[str, Any]:
+    return {"srid": point.srid, "coordinates": list(point)}
+
+
+# Neo4j values orjson can't encode natively, dispatched on exact type so the
+# default hook is one dict lookup. Numpy values go through OPT_SERIALIZE_NUMPY.
+_ORJSON_DISPATCH: Dict[type, Callable[[Any], Any]] = {
+    neo4j_time.DateTime: neo4j_time.DateTime.iso_format,
+    neo4j_time.Date: neo4j_time.Date.iso_format,
+    neo4j_time.Time: neo4j_time.Time.iso_format,
+    neo4j_time.Duration: neo4j_time.Duration.iso_format,
+    Node: dict,
+    Relationship: dict,
+    Path: _encode_path,
+    Point: _encode_point,
+    CartesianPoint: _encode_point,
+    WGS84Point: _encode_point,
+    # Neo4j ByteArray properties, as base64 text
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+}
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize values orjson doesn't know natively (Neo4j temporal/graph/spatial types)."""
+    encode = _ORJSON_DISPATCH.get(type(obj))
+    if encode is not None:
+        return encode(obj)
+    # The driver builds a Relationship subclass per type for each result, so
+    # these are matched by isinstance rather than added to the dispatch table
+    if isinstance(obj, Relationship):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def json_dumps(obj: Any) -> bytes:
+    """orjson.dumps with the shared default hook and options."""
+    return orjson.dumps(obj, default=orjson_default, option=_ORJSON_OPTIONS)
+
+
+def json_response(payload: Any, status_code: int = 200) -> Response:
+    """Serialize a payload straight to a JSON Response, bypassing jsonable_encoder."""
+    return Response(json_dumps(payload), status_code=status_code, media_type="application/json")
@@ -0,0 +1,70 @@
+import csv
+import io
+
+import pytest
+
+from app.routers import export
+from app.routers.export import _CSVRows, _stream_csv
+
+
+def _parse(text, delimiter=","):
+    return list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+
+
+def test_csv_rows_writes_header_from_first_record():
+    render = _CSVRows()
+    text = render({"id": "e1", "count": 3}) + render({"id": "e2", "count": None})
+    assert text == "id,count\r\ne1,3\r\ne2,\r\n"
+
+
+@pytest.mark.parametrize("value", [
+    'say "hi"',
+    "a,b",
+    "line one\nline two",
+    "carriage\rreturn",
+    "",
+])
+def test_csv_rows_quotes_values_like_csv_writer(value):
+    render = _CSVRows()
+    text = render({"id": "e1", "name": value})
+    assert _parse(text) == [["id", "name"], ["e1", value]]
+
+    expected = io.StringIO()
+    csv.writer(expected).writerows([["id", "name"], ["e1", value]])
+    assert text == expected.getvalue()
+
+
+def test_csv_rows_quotes_single_column_values():
+    render = _CSVRows()
+    text = render({"name": "plain"}) + render({"name": "a,b"})
+    assert _parse(text) == [["name"], ["plain"], ["a,b"]]
+
+
+def test_csv_rows_respects_custom_delimiter():
+    render = _CSVRows(delimiter="\t")
+    text = render({"id": "e1", "name": "tab\there"}) + render({"id": "e2", "name": "a,b"})
+    assert _parse(text, delimiter="\t") == [["id", "name"], ["e1", "tab\there"], ["e2", "a,b"]]
+    assert text.endswith("e2\ta,b\r\n")
+
+
+def test_stream_csv_chunks_round_trip(monkeypatch):
+    monkeypatch.setattr(export, "_CSV_CHUNK_CHARS", 16)
+    records = [{"id": f"e{i}", "name": f'name "{i}", x'} for i in range(20)]
+    chunks = list(_stream_csv(iter(records)))
+    assert len(chunks) > 1
+    rows = _parse(b"".join(chunks).decode("utf-8"))
+    assert rows[0] == ["id", "name"]
+    assert rows[1:] == [[r["id"], r["name"]] for r in records]
+
+
+def test_stream_csv_empty_input_yields_nothing():
+    assert list(_stream_csv(iter([]))) == []
+
+
+def test_stream_csv_reraises_mid_stream_failure():
+    def records():
+        yield {"id": "e1"}
+        raise RuntimeError("connection lost")
+
+    with pytest.raises(RuntimeError, match="connection lost"):
+        list(_stream_csv(records()))
@@ -0,0 +1,21 @@
+from app.routers.graph import _normalize_query
+
+
+def test_normalize_query_collapses_whitespace_outside_literals():
+    query = "MATCH  (n)\n\tWHERE n.title = 'a   b'   RETURN n ;"
+    assert _normalize_query(query) == ("MATCH (n) WHERE n.title = 'a   b' RETURN n", False)
+
+
+def test_normalize_query_drops_comments():
+    query = "MATCH (n) // trailing\nRETURN n /* LIMIT 5 */"
+    assert _normalize_query(query) == ("MATCH (n) RETURN n", False)
+
+
+def test_normalize_query_gives_equivalent_queries_one_text():
+    assert _normalize_query("MATCH (n)\nRETURN n") == _normalize_query("  MATCH (n)   RETURN n;")
+
+
+def test_normalize_query_reports_limit_only_as_keyword():
+    assert _normalize_query("MATCH (n) RETURN n limit 5")[1]
+    assert not _normalize_query("MATCH (n) WHERE n.title = 'LIMIT' RETURN n")[1]
+    assert not _normalize_query("MATCH (n) RETURN n.rate_limit")[1]
@@ -0,0 +1,49 @@
+import pytest
+
+from app.routers.graph import _is_safe_query
+
+
+@pytest.mark.parametrize("query", [
+    "MATCH (n:Publication) RETURN n LIMIT 10",
+    "MATCH (n) WHERE n.title = 'How to CREATE a dataset' RETURN n",
+    'MATCH (n) WHERE n.note = "DELETE me" RETURN n',
+    r"MATCH (n) WHERE n.title = 'it\'s MERGE time' RETURN n",
+    "MATCH (n:`SET`) RETURN n",
+    "MATCH (n) // CALL db.labels()\nRETURN n",
+    "MATCH (n) /* DETACH DELETE n */ RETURN n",
+])
+def test_is_safe_query_skips_literals_and_comments(query):
+    assert _is_safe_query(query)
+
+
+@pytest.mark.parametrize("query", [
+    "MATCH (n) DETACH DELETE n",
+    "CREATE (n:Entity {name: 'x'})",
+    "MERGE (n:Entity {name: 'x'}) RETURN n",
+    "MATCH (n) REMOVE n.title",
+    "CALL db.labels()",
+    "LOAD CSV FROM 'file:///x.csv' AS row RETURN row",
+    "DROP INDEX page_embedding",
+    "MATCH (n) WHERE n.title = 'safe' DELETE n",
+    "MATCH (n) /* comment */ DELETE n",
+])
+def test_is_safe_query_rejects_write_clauses(query):
+    assert not _is_safe_query(query)
+
+
+@pytest.mark.parametrize("query", [
+    "MATCH (n) RETURN n.created_at, n.reset_count",
+    "MATCH (n) WHERE n.is_dropped = false RETURN n.caller",
+    "MATCH (n:Dataset) RETURN n.upload_date",
+])
+def test_is_safe_query_matches_whole_words_only(query):
+    assert _is_safe_query(query)
+
+
+@pytest.mark.parametrize("query", [
+    "MATCH (n) set n.flag = true",
+    "match (n) Detach Delete n",
+    "call db.labels()",
+])
+def test_is_safe_query_is_case_insensitive(query):
+    assert not _is_safe_query(query)